@@ -6,32 +6,84 @@ to create seamless, high-quality ambient soundscapes.
 """
 
 import os
+import shutil
 import subprocess
 import tempfile
 from pathlib import Path
 from typing import Optional
 
 from rich.console import Console
+from rich.markup import escape
 
 console = Console()
 
+# Binaries resolved once at import; passing absolute paths to subprocess
+# skips per-spawn PATH resolution
+_FFMPEG = shutil.which("ffmpeg") or "ffmpeg"
+_FFPROBE = shutil.which("ffprobe") or "ffprobe"
+
+# Encoder settings for the final export. "mp3_fast" trades a little
+# quality for lame's fastest VBR mode; "opus" encodes several times
+# faster than mp3 at comparable quality (use a .opus output path).
+CODEC_ARGS: dict[str, list[str]] = {
+    "mp3": ["-c:a", "libmp3lame", "-b:a", "192k"],
+    "mp3_fast": ["-c:a", "libmp3lame", "-q:a", "7"],
+    "opus": ["-c:a", "libopus", "-b:a", "128k", "-vbr", "on",
+             "-compression_level", "0"],
+}
+
+
+def _codec_args(codec: str) -> list[str]:
+    """Get encoder arguments for a codec name."""
+    if codec not in CODEC_ARGS:
+        available = ", ".join(CODEC_ARGS.keys())
+        raise ValueError(f"Unknown codec '{codec}'. Available: {available}")
+    return CODEC_ARGS[codec]
+
+
+# Output sample rate per codec; libopus only accepts 48 kHz and its
+# divisors, so it cannot take the 44.1 kHz everything else uses
+_CODEC_RATES: dict[str, str] = {"opus": "48000"}
+
+
+def _codec_rate(codec: str) -> str:
+    """Get the output sample rate for a codec name."""
+    return _CODEC_RATES.get(codec, "44100")
+
 
 class AudioProcessor:
     """Processes audio files for optimal loop playback."""
-    
+
+    # Probe result shared across instances; ffmpeg doesn't come and go
+    # mid-process, so one successful check covers the whole run
+    _ffmpeg_checked: bool = False
+
     def __init__(self, debug: bool = False):
         self.debug = debug
+        self._duration_cache: dict = {}
         self._check_ffmpeg()
-    
+
     def _check_ffmpeg(self) -> None:
         """Verify FFmpeg is installed and accessible."""
+        if AudioProcessor._ffmpeg_checked:
+            return
+
+        # PATH lookup needs no fork; only fall back to spawning
+        # ffmpeg if the lookup is inconclusive
+        if shutil.which("ffmpeg"):
+            AudioProcessor._ffmpeg_checked = True
+            if self.debug:
+                console.print("[dim]FFmpeg found[/dim]")
+            return
+
         try:
-            result = subprocess.run(
+            subprocess.run(
                 ["ffmpeg", "-version"],
                 capture_output=True,
                 text=True,
                 check=True
             )
+            AudioProcessor._ffmpeg_checked = True
             if self.debug:
                 console.print("[dim]FFmpeg found[/dim]")
         except FileNotFoundError:
@@ -46,59 +98,150 @@ class AudioProcessor:
     
     def _run_ffmpeg(self, args: list[str]) -> None:
         """Run an FFmpeg command with error handling."""
-        cmd = ["ffmpeg", "-y"] + args
+        loglevel = "info" if self.debug else "error"
+        cmd = [
+            _FFMPEG, "-y",
+            "-hide_banner", "-loglevel", loglevel, "-nostats"
+        ] + args
         if self.debug:
-            console.print(f"[dim]Running: {' '.join(cmd)}[/dim]")
-        
+            # Escaped: filter labels like [a] would otherwise be
+            # swallowed as markup
+            console.print(f"[dim]Running: {escape(' '.join(cmd))}[/dim]")
+
+        # Keep stderr (errors stay diagnosable) but as raw bytes —
+        # decoding happens only on the failure path
         result = subprocess.run(
             cmd,
-            capture_output=True,
-            text=True
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
         )
-        
+
         if result.returncode != 0:
+            stderr = result.stderr.decode("utf-8", errors="replace")
             if self.debug:
-                console.print(f"[red]FFmpeg error: {result.stderr}[/red]")
-            raise RuntimeError(f"FFmpeg failed: {result.stderr}")
+                console.print(f"[red]FFmpeg error: {escape(stderr)}[/red]")
+            raise RuntimeError(f"FFmpeg failed: {stderr}")
     
+    # Fast single-pass dynamic normalization; no lookahead analysis,
+    # several times faster than loudnorm at the cost of EBU precision.
+    FAST_NORMALIZE_FILTER = "dynaudnorm=p=0.95:m=10:f=150:g=15"
+
+    def _measure_loudness(
+        self,
+        input_path: str,
+        target_loudness: float = -16.0
+    ) -> Optional[dict]:
+        """
+        Run a loudnorm analysis pass and return the measured stats.
+
+        Returns:
+            Dict with measured_I/TP/LRA/thresh/offset values, or None
+            if the analysis output could not be parsed
+        """
+        import json
+
+        result = subprocess.run(
+            [
+                _FFMPEG, "-i", input_path,
+                "-af", f"loudnorm=I={target_loudness}:TP=-1.5:LRA=11:print_format=json",
+                "-f", "null", "-"
+            ],
+            capture_output=True,
+            text=True
+        )
+
+        # loudnorm tags its JSON block with "[Parsed_loudnorm" near the
+        # end of stderr; ffmpeg prints summary lines after it, so the
+        # block must be located by the tag and parsed as a prefix
+        # (raw_decode tolerates the trailing text)
+        stderr = result.stderr
+        marker = stderr.rfind("[Parsed_loudnorm")
+        if marker == -1:
+            return None
+        start = stderr.find("{", marker)
+        if start == -1:
+            return None
+        try:
+            stats, _ = json.JSONDecoder().raw_decode(stderr, start)
+            return {
+                "measured_I": stats["input_i"],
+                "measured_TP": stats["input_tp"],
+                "measured_LRA": stats["input_lra"],
+                "measured_thresh": stats["input_thresh"],
+                "offset": stats["target_offset"],
+            }
+        except (json.JSONDecodeError, KeyError):
+            return None
+
+    def _normalize_filter(
+        self,
+        input_path: Optional[str],
+        target_loudness: float = -16.0,
+        mode: str = "fast"
+    ) -> str:
+        """
+        Build the normalization filter string for the given mode.
+
+        Args:
+            input_path: Input file (analyzed in accurate mode), or
+                None when the input is a stream that cannot be
+                analyzed ahead of time
+            target_loudness: Target loudness in LUFS
+            mode: "fast" for single-pass dynaudnorm, "accurate" for
+                two-pass loudnorm with measured linear correction
+
+        Returns:
+            FFmpeg audio filter string
+        """
+        if mode != "accurate":
+            return self.FAST_NORMALIZE_FILTER
+
+        base = f"loudnorm=I={target_loudness}:TP=-1.5:LRA=11"
+        if input_path is None:
+            # Streams can't be pre-analyzed; single-pass loudnorm
+            return base
+
+        measured = self._measure_loudness(input_path, target_loudness)
+        if measured is None:
+            # Fall back to single-pass loudnorm if analysis failed
+            return base
+        measured_str = ":".join(f"{k}={v}" for k, v in measured.items())
+        return f"{base}:{measured_str}:linear=true"
+
     def normalize_volume(
-        self, 
-        input_path: str, 
+        self,
+        input_path: str,
         output_path: str,
-        target_loudness: float = -16.0
+        target_loudness: float = -16.0,
+        mode: str = "fast"
     ) -> str:
         """
-        Normalize audio volume to target loudness (LUFS).
-        
+        Normalize audio volume.
+
         Args:
             input_path: Path to input audio file
             output_path: Path for normalized output
-            target_loudness: Target loudness in LUFS (default -16)
-        
+            target_loudness: Target loudness in LUFS (default -16,
+                accurate mode only)
+            mode: "fast" for single-pass dynaudnorm (default),
+                "accurate" for two-pass EBU R128 loudnorm
+
         Returns:
             Path to normalized audio file
         """
-        # First pass: analyze loudness
-        analyze_args = [
-            "-i", input_path,
-            "-af", f"loudnorm=I={target_loudness}:TP=-1.5:LRA=11:print_format=json",
-            "-f", "null", "-"
-        ]
-        
-        # For simplicity, use single-pass normalization
         normalize_args = [
             "-i", input_path,
-            "-af", f"loudnorm=I={target_loudness}:TP=-1.5:LRA=11",
+            "-af", self._normalize_filter(input_path, target_loudness, mode),
             "-ar", "44100",
             "-b:a", "192k",
             output_path
         ]
-        
+
         self._run_ffmpeg(normalize_args)
-        
+
         if self.debug:
-            console.print(f"[green]✓[/green] Volume normalized to {target_loudness} LUFS")
-        
+            console.print(f"[green]✓[/green] Volume normalized ({mode} mode)")
+
         return output_path
     
     def apply_fades(
@@ -165,71 +308,37 @@ class AudioProcessor:
             Path to loop-optimized audio file
         """
         duration = self._get_duration(input_path)
-        
+
         if duration < crossfade_duration * 2:
             # Audio too short for crossfade, just copy
             self._run_ffmpeg(["-i", input_path, "-c", "copy", output_path])
             return output_path
-        
-        # Create a crossfaded loop by:
-        # 1. Taking the end portion
-        # 2. Crossfading it with the beginning
-        # 3. Reconstructing the full audio
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Extract end portion for crossfade
-            end_portion = os.path.join(tmpdir, "end.wav")
-            start_time = duration - crossfade_duration
-            
-            self._run_ffmpeg([
-                "-i", input_path,
-                "-ss", str(start_time),
-                "-t", str(crossfade_duration),
-                end_portion
-            ])
-            
-            # Extract beginning for crossfade
-            begin_portion = os.path.join(tmpdir, "begin.wav")
-            self._run_ffmpeg([
-                "-i", input_path,
-                "-t", str(crossfade_duration),
-                begin_portion
-            ])
-            
-            # Create crossfaded portion
-            crossfade_out = os.path.join(tmpdir, "crossfade.wav")
-            self._run_ffmpeg([
-                "-i", end_portion,
-                "-i", begin_portion,
-                "-filter_complex",
-                f"acrossfade=d={crossfade_duration}:c1=tri:c2=tri",
-                crossfade_out
-            ])
-            
-            # Extract middle portion
-            middle_portion = os.path.join(tmpdir, "middle.wav")
-            self._run_ffmpeg([
-                "-i", input_path,
-                "-ss", str(crossfade_duration),
-                "-t", str(duration - crossfade_duration * 2),
-                middle_portion
-            ])
-            
-            # Concatenate: crossfade + middle
-            concat_list = os.path.join(tmpdir, "concat.txt")
-            with open(concat_list, "w") as f:
-                f.write(f"file '{crossfade_out}'\n")
-                f.write(f"file '{middle_portion}'\n")
-            
-            self._run_ffmpeg([
-                "-f", "concat",
-                "-safe", "0",
-                "-i", concat_list,
-                "-c:a", "libmp3lame",
-                "-b:a", "192k",
-                output_path
-            ])
-        
+
+        # Cut head/middle/tail virtually (atrim), crossfade the tail
+        # into the head, and stitch the join back onto the middle —
+        # all in one filter graph, with no intermediate tempfiles.
+        graph = self._build_filter_graph(
+            input_path=input_path,
+            duration=duration,
+            normalize=False,
+            fade_in=0,
+            fade_out=0,
+            loop_optimize=True,
+            crossfade=crossfade_duration
+        )
+
+        # Three decodes of the same file: the loop graph cuts its
+        # segments from separate input streams (see _build_filter_graph)
+        args = [
+            "-i", input_path, "-i", input_path, "-i", input_path,
+            "-filter_complex", graph, "-map", "[a]"
+        ]
+        if output_path.lower().endswith(".mp3"):
+            args += ["-c:a", "libmp3lame", "-b:a", "192k"]
+        args.append(output_path)
+
+        self._run_ffmpeg(args)
+
         if self.debug:
             console.print(
                 f"[green]✓[/green] Loop optimized with {crossfade_duration}s crossfade"
@@ -238,21 +347,119 @@ class AudioProcessor:
         return output_path
     
     def _get_duration(self, file_path: str) -> float:
-        """Get the duration of an audio file in seconds."""
+        """
+        Get the duration of an audio file in seconds.
+
+        Reads the duration from file headers in-process where possible
+        (soundfile if installed, stdlib wave for WAV files), spawning
+        ffprobe only for containers neither can parse. Results are
+        memoized per (path, mtime, size).
+        """
+        stat = os.stat(file_path)
+        cache_key = (file_path, stat.st_mtime, stat.st_size)
+        cached = self._duration_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        duration = self._read_duration(file_path)
+        self._duration_cache[cache_key] = duration
+        return duration
+
+    def _read_duration(self, file_path: str) -> float:
+        """Read audio duration from headers, falling back to ffprobe."""
+        try:
+            import soundfile
+            return soundfile.info(file_path).duration
+        except ImportError:
+            pass
+        except Exception:
+            # Container not supported by libsndfile; fall through
+            pass
+
+        if file_path.lower().endswith(".wav"):
+            import wave
+            try:
+                with wave.open(file_path, "rb") as wav_file:
+                    return wav_file.getnframes() / wav_file.getframerate()
+            except wave.Error:
+                pass
+
         result = subprocess.run(
             [
-                "ffprobe",
+                _FFPROBE,
                 "-v", "error",
                 "-show_entries", "format=duration",
                 "-of", "default=noprint_wrappers=1:nokey=1",
                 file_path
             ],
             capture_output=True,
-            text=True,
             check=True
         )
+        # float() accepts bytes-adjacent ASCII; no locale decode needed
         return float(result.stdout.strip())
     
+    def _build_filter_graph(
+        self,
+        input_path: str,
+        duration: float,
+        normalize: bool,
+        fade_in: float,
+        fade_out: float,
+        loop_optimize: bool,
+        crossfade: float,
+        target_loudness: float = -16.0,
+        normalize_mode: str = "fast"
+    ) -> Optional[str]:
+        """
+        Build a single filter_complex graph for the full pipeline.
+
+        Chains normalization and fades into one filter pass, and when
+        loop optimization is requested, crossfades the tail into the
+        head entirely in-graph (atrim/acrossfade/concat) instead of
+        extracting segments to tempfiles. The loop graph reads three
+        input streams, so callers must supply the file as three ``-i``
+        arguments whenever the returned graph references ``[2:a]``.
+
+        Returns:
+            The filter graph string, or None if no filtering is needed
+        """
+        # Linear chain: normalize -> fade in -> fade out
+        chain = []
+        if normalize:
+            chain.append(
+                self._normalize_filter(input_path, target_loudness, normalize_mode)
+            )
+        if fade_in > 0:
+            chain.append(f"afade=t=in:st=0:d={fade_in}")
+        if fade_out > 0:
+            fade_out_start = duration - fade_out
+            chain.append(f"afade=t=out:st={fade_out_start}:d={fade_out}")
+
+        # Loop optimization needs enough audio to crossfade
+        do_loop = loop_optimize and crossfade > 0 and duration >= crossfade * 2
+
+        if not do_loop:
+            if not chain:
+                return None
+            return f"[0:a]{','.join(chain)}[a]"
+
+        process = f"{','.join(chain)}," if chain else ""
+        tail_start = duration - crossfade
+
+        # Head, middle and tail are cut from three separate decodes of
+        # the input rather than one asplit: acrossfade stalls and emits
+        # nothing when both of its inputs branch off the same splitter.
+        # The chain is deterministic, so running it once per decode
+        # keeps the segments sample-aligned.
+        return (
+            f"[0:a]{process}atrim=0:{crossfade},asetpts=PTS-STARTPTS[head];"
+            f"[1:a]{process}atrim={crossfade}:{tail_start},"
+            f"asetpts=PTS-STARTPTS[mid];"
+            f"[2:a]{process}atrim={tail_start},asetpts=PTS-STARTPTS[tail];"
+            f"[tail][head]acrossfade=d={crossfade}:c1=tri:c2=tri[xf];"
+            f"[xf][mid]concat=n=2:v=0:a=1[a]"
+        )
+
     def process_full_pipeline(
         self,
         input_path: str,
@@ -261,11 +468,17 @@ class AudioProcessor:
         fade_in: float = 0.5,
         fade_out: float = 0.5,
         loop_optimize: bool = True,
-        crossfade: float = 1.0
+        crossfade: float = 1.0,
+        normalize_mode: str = "fast",
+        codec: str = "mp3"
     ) -> str:
         """
         Run the full audio processing pipeline.
-        
+
+        All stages (normalize, fades, loop crossfade, MP3 export) are
+        fused into a single FFmpeg invocation with one filter_complex
+        graph, avoiding intermediate decode/encode round-trips.
+
         Args:
             input_path: Path to raw generated audio
             output_path: Final output path
@@ -274,58 +487,344 @@ class AudioProcessor:
             fade_out: Fade-out duration (0 to disable)
             loop_optimize: Whether to optimize for looping
             crossfade: Crossfade duration for loop optimization
-        
+            normalize_mode: "fast" or "accurate" normalization
+            codec: Output codec key from CODEC_ARGS
+
         Returns:
             Path to fully processed audio file
         """
-        current_path = input_path
-        
-        with tempfile.TemporaryDirectory() as tmpdir:
-            step = 0
-            
-            if normalize:
-                step += 1
-                next_path = os.path.join(tmpdir, f"step{step}_normalized.wav")
-                current_path = self.normalize_volume(current_path, next_path)
-            
-            if fade_in > 0 or fade_out > 0:
-                step += 1
-                next_path = os.path.join(tmpdir, f"step{step}_faded.wav")
-                current_path = self.apply_fades(
-                    current_path, next_path,
-                    fade_in_duration=fade_in,
-                    fade_out_duration=fade_out
-                )
-            
-            if loop_optimize:
-                step += 1
-                next_path = os.path.join(tmpdir, f"step{step}_looped.wav")
-                current_path = self.optimize_for_loop(
-                    current_path, next_path,
-                    crossfade_duration=crossfade
+        duration = self._get_duration(input_path)
+
+        graph = self._build_filter_graph(
+            input_path=input_path,
+            duration=duration,
+            normalize=normalize,
+            fade_in=fade_in,
+            fade_out=fade_out,
+            loop_optimize=loop_optimize,
+            crossfade=crossfade,
+            normalize_mode=normalize_mode
+        )
+
+        # Nothing to filter and already MP3: re-encoding would only add
+        # a lossy generation, so just move the file into place
+        if (graph is None and codec.startswith("mp3")
+                and input_path.lower().endswith(".mp3")):
+            if os.path.abspath(input_path) != os.path.abspath(output_path):
+                shutil.move(input_path, output_path)
+            if self.debug:
+                console.print("[green]✓[/green] No processing needed, moved as-is")
+            return output_path
+
+        args = ["-i", input_path]
+        if graph:
+            # The loop graph cuts its segments from separate decodes of
+            # the same file (see _build_filter_graph)
+            if "[2:a]" in graph:
+                args += ["-i", input_path, "-i", input_path]
+            args += ["-filter_complex", graph, "-map", "[a]"]
+        args += _codec_args(codec) + ["-ar", _codec_rate(codec), output_path]
+
+        self._run_ffmpeg(args)
+
+        if self.debug:
+            console.print("[green]✓[/green] Audio pipeline complete (single pass)")
+
+        return output_path
+
+    def process_batch(
+        self,
+        jobs: list,
+        max_workers: Optional[int] = None,
+        **kwargs
+    ) -> list[str]:
+        """
+        Run the full pipeline over several files concurrently.
+
+        Each job is a whole ffmpeg subprocess, so threads are enough:
+        the GIL is released while the children do the actual work.
+
+        Args:
+            jobs: List of (input_path, output_path) pairs
+            max_workers: Concurrency cap (defaults to CPU count)
+            **kwargs: Passed through to process_full_pipeline
+
+        Returns:
+            List of output paths, in job order
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        if not jobs:
+            return []
+        if max_workers is None:
+            max_workers = min(len(jobs), os.cpu_count() or 1)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(
+                    self.process_full_pipeline, input_path, output_path, **kwargs
                 )
-            
-            # Final export to MP3
-            self._run_ffmpeg([
-                "-i", current_path,
-                "-c:a", "libmp3lame",
-                "-b:a", "192k",
-                "-ar", "44100",
-                output_path
-            ])
-        
+                for input_path, output_path in jobs
+            ]
+            return [future.result() for future in futures]
+
+    def process_pcm_pipeline(
+        self,
+        pcm: bytes,
+        sample_rate: int,
+        channels: int,
+        output_path: str,
+        normalize: bool = True,
+        fade_in: float = 0.5,
+        fade_out: float = 0.5,
+        loop_optimize: bool = True,
+        crossfade: float = 1.0,
+        normalize_mode: str = "fast",
+        codec: str = "mp3"
+    ) -> str:
+        """
+        Run the full pipeline on an in-memory PCM buffer.
+
+        Pipes raw 16-bit samples straight into ffmpeg's stdin instead
+        of round-tripping an uncompressed WAV through the filesystem.
+        Accurate normalization degrades to single-pass loudnorm since
+        a stream cannot be pre-analyzed.
+
+        Args:
+            pcm: Interleaved signed 16-bit little-endian samples
+            sample_rate: Sample rate of the buffer
+            channels: Number of interleaved channels
+            output_path: Final output path
+            normalize: Whether to normalize volume
+            fade_in: Fade-in duration (0 to disable)
+            fade_out: Fade-out duration (0 to disable)
+            loop_optimize: Whether to optimize for looping
+            crossfade: Crossfade duration for loop optimization
+            normalize_mode: "fast" or "accurate" normalization
+            codec: Output codec key from CODEC_ARGS
+
+        Returns:
+            Path to fully processed audio file
+        """
+        import numpy as np
+
+        frames = np.frombuffer(pcm, dtype=np.int16).reshape(-1, channels)
+
+        if normalize_mode != "accurate":
+            # Fast mode: everything but the encode is memory-bound, so
+            # run crossfade, fades and peak normalization as one fused
+            # in-memory pass and hand ffmpeg a finished buffer
+            frames = process_pcm_fused(
+                frames, sample_rate,
+                normalize=normalize,
+                fade_in=fade_in,
+                fade_out=fade_out,
+                loop_optimize=loop_optimize,
+                crossfade=crossfade
+            )
+            pcm = frames.tobytes()
+            normalize = False
+            fade_in = fade_out = 0.0
+            loop_optimize = False
+        elif loop_optimize and crossfade > 0:
+            # Accurate mode keeps loudnorm in-graph, but the loop
+            # crossfade is still a cheap vectorized blend here
+            looped = crossfade_loop_pcm(frames, sample_rate, crossfade)
+            if looped is not frames:
+                pcm = looped.tobytes()
+            loop_optimize = False
+
+        duration = len(pcm) / (2 * channels * sample_rate)
+
+        graph = self._build_filter_graph(
+            input_path=None,
+            duration=duration,
+            normalize=normalize,
+            fade_in=fade_in,
+            fade_out=fade_out,
+            loop_optimize=loop_optimize,
+            crossfade=crossfade,
+            normalize_mode=normalize_mode
+        )
+
+        cmd = [
+            _FFMPEG, "-y",
+            "-f", "s16le",
+            "-ar", str(sample_rate),
+            "-ac", str(channels),
+            "-i", "pipe:0"
+        ]
+        if graph:
+            cmd += ["-filter_complex", graph, "-map", "[a]"]
+        cmd += _codec_args(codec) + ["-ar", _codec_rate(codec), output_path]
+
+        if self.debug:
+            console.print(f"[dim]Streaming {len(pcm)} PCM bytes to ffmpeg[/dim]")
+
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
+        )
+        _, stderr = proc.communicate(pcm)
+
+        if proc.returncode != 0:
+            message = stderr.decode(errors="replace")
+            if self.debug:
+                console.print(f"[red]FFmpeg error: {escape(message)}[/red]")
+            raise RuntimeError(f"FFmpeg failed: {message}")
+
+        if self.debug:
+            console.print("[green]✓[/green] Audio pipeline complete (streamed)")
+
         return output_path
 
 
+def crossfade_loop_pcm(pcm, sample_rate: int, crossfade: float):
+    """
+    Blend the tail of a PCM clip into its head for seamless looping.
+
+    Equivalent to the ffmpeg asplit/acrossfade/concat graph, but a
+    single vectorized pass over an in-memory array: the tail is ramped
+    down, the head ramped up, and their sum replaces the head segment.
+
+    Args:
+        pcm: Sample array of shape (frames,) or (frames, channels)
+        sample_rate: Sample rate of the clip
+        crossfade: Crossfade duration in seconds
+
+    Returns:
+        Loop-optimized array with the same dtype, shorter by one
+        crossfade's worth of frames (or the input unchanged if the
+        clip is too short to crossfade)
+    """
+    import numpy as np
+
+    n = int(crossfade * sample_rate)
+    if n <= 0 or len(pcm) < n * 2:
+        return pcm
+
+    ramp = np.linspace(0.0, 1.0, n, dtype=np.float32)
+    if pcm.ndim == 2:
+        ramp = ramp[:, None]
+
+    head = pcm[:n].astype(np.float32)
+    tail = pcm[-n:].astype(np.float32)
+    blended = tail * (1.0 - ramp) + head * ramp
+
+    out = np.concatenate([blended, pcm[n:-n].astype(np.float32)])
+    return out.astype(pcm.dtype)
+
+
+def process_pcm_fused(
+    frames,
+    sample_rate: int,
+    normalize: bool = True,
+    fade_in: float = 0.5,
+    fade_out: float = 0.5,
+    loop_optimize: bool = True,
+    crossfade: float = 1.0
+):
+    """
+    Fused in-memory pipeline: loop crossfade, fades, peak normalize.
+
+    The stages share one float32 working buffer and mutate it in
+    place, so the samples make a single round trip through memory
+    instead of one full read/write per stage. Normalization here is
+    peak-based (scaled to -1 dBFS); callers wanting loudness-accurate
+    EBU R128 normalization should keep that stage in ffmpeg.
+
+    Args:
+        frames: Sample array of shape (frames,) or (frames, channels)
+        sample_rate: Sample rate of the clip
+        normalize: Scale the peak to -1 dBFS
+        fade_in: Fade-in duration in seconds (0 to disable)
+        fade_out: Fade-out duration in seconds (0 to disable)
+        loop_optimize: Crossfade the tail into the head
+        crossfade: Crossfade duration in seconds
+
+    Returns:
+        Processed array with the input's dtype
+    """
+    import numpy as np
+
+    if loop_optimize:
+        frames = crossfade_loop_pcm(frames, sample_rate, crossfade)
+
+    dtype = frames.dtype
+    integer = np.issubdtype(dtype, np.integer)
+    full_scale = float(np.iinfo(dtype).max) if integer else 1.0
+    samples = frames.astype(np.float32)
+
+    n_in = int(fade_in * sample_rate)
+    if 0 < n_in <= len(samples):
+        ramp = np.linspace(0.0, 1.0, n_in, dtype=np.float32)
+        if samples.ndim == 2:
+            ramp = ramp[:, None]
+        samples[:n_in] *= ramp
+
+    n_out = int(fade_out * sample_rate)
+    if 0 < n_out <= len(samples):
+        ramp = np.linspace(1.0, 0.0, n_out, dtype=np.float32)
+        if samples.ndim == 2:
+            ramp = ramp[:, None]
+        samples[-n_out:] *= ramp
+
+    if normalize:
+        peak = float(np.max(np.abs(samples)))
+        if peak > 0:
+            # 10 ** (-1 / 20): leave 1 dB of headroom
+            samples *= (0.891 * full_scale) / peak
+
+    if integer:
+        info = np.iinfo(dtype)
+        np.clip(samples, info.min, info.max, out=samples)
+    return samples.astype(dtype)
+
+
+_SCRATCH: Optional[tempfile.TemporaryDirectory] = None
+
+
+def scratch_dir() -> str:
+    """
+    Get the process-lifetime scratch directory for audio intermediates.
+
+    Created lazily on first use (RAM-backed when possible) and cleaned
+    up at interpreter exit, so repeated generations reuse one directory
+    instead of paying TemporaryDirectory setup/teardown per run.
+    Callers should work in unique subpaths within it.
+    """
+    global _SCRATCH
+    if _SCRATCH is None:
+        import atexit
+
+        _SCRATCH = tempfile.TemporaryDirectory(prefix="fmag_", dir=best_tmp_dir())
+        atexit.register(_SCRATCH.cleanup)
+    return _SCRATCH.name
+
+
+def best_tmp_dir() -> Optional[str]:
+    """
+    Pick the fastest usable temp directory for audio intermediates.
+
+    Prefers RAM-backed /dev/shm on Linux (with a free-space sanity
+    check) so multi-minute WAV scratch files never hit the disk.
+
+    Returns:
+        Directory path, or None to use the tempfile default
+    """
+    shm = "/dev/shm"
+    if os.path.isdir(shm) and os.access(shm, os.W_OK):
+        try:
+            if shutil.disk_usage(shm).free >= 500 * 1024 * 1024:
+                return shm
+        except OSError:
+            pass
+    return None
+
+
 def check_ffmpeg_installed() -> bool:
     """Check if FFmpeg is installed on the system."""
-    try:
-        subprocess.run(
-            ["ffmpeg", "-version"],
-            capture_output=True,
-            check=True
-        )
-        return True
-    except (FileNotFoundError, subprocess.CalledProcessError):
-        return False
+    return shutil.which("ffmpeg") is not None
 
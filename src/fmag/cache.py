@@ -0,0 +1,177 @@
+"""
+Content-addressed cache for generated ambience files.
+
+Generation is by far the most expensive step in the pipeline, so
+repeat runs with the same mood, duration, and settings are served
+from a local cache directory instead of regenerating from scratch.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+# Bump when pipeline changes invalidate previously cached output
+CACHE_VERSION = "1"
+
+# Evict least-recently-used entries beyond this total size
+MAX_CACHE_BYTES = 2 * 1024 ** 3
+
+
+def get_cache_dir() -> Path:
+    """Get the FMAG cache directory, creating it if needed."""
+    base = os.environ.get("XDG_CACHE_HOME")
+    if base:
+        cache_dir = Path(base) / "fmag"
+    else:
+        cache_dir = Path.home() / ".cache" / "fmag"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def cache_key(
+    mood: str,
+    duration_minutes: float,
+    provider: Optional[str] = None,
+    extra: str = ""
+) -> str:
+    """
+    Compute the cache key for a generation request.
+
+    Args:
+        mood: Mood preset name or custom prompt
+        duration_minutes: Requested duration in minutes
+        provider: Provider name (None for auto-detect)
+        extra: Additional settings that affect the output
+            (e.g. fade/loop/normalization flags)
+
+    Returns:
+        Hex digest identifying this exact request
+    """
+    raw = f"{mood}|{duration_minutes}|{provider or 'auto'}|{extra}|{CACHE_VERSION}"
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _index_path() -> Path:
+    """Path of the access-time index used for LRU eviction."""
+    return get_cache_dir() / "index.json"
+
+
+def _load_index() -> dict:
+    """Load the cache index (empty on first use or corruption)."""
+    try:
+        with open(_index_path()) as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_index(index: dict) -> None:
+    """Persist the cache index atomically."""
+    path = _index_path()
+    tmp = path.with_suffix(".json.tmp")
+    try:
+        with open(tmp, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _touch(key: str, size: int) -> None:
+    """Record an access to a cache entry."""
+    index = _load_index()
+    index[key] = {"atime": time.time(), "size": size}
+    _save_index(index)
+
+
+def _evict_lru() -> None:
+    """Drop least-recently-used entries until under the size cap."""
+    index = _load_index()
+    total = sum(entry.get("size", 0) for entry in index.values())
+    if total <= MAX_CACHE_BYTES:
+        return
+
+    cache_dir = get_cache_dir()
+    for key in sorted(index, key=lambda k: index[k].get("atime", 0)):
+        if total <= MAX_CACHE_BYTES:
+            break
+        entry = index.pop(key)
+        total -= entry.get("size", 0)
+        try:
+            os.remove(cache_dir / f"{key}.mp3")
+        except OSError:
+            pass
+    _save_index(index)
+
+
+def cache_lookup(key: str) -> Optional[Path]:
+    """
+    Look up a cached generation by key.
+
+    Returns:
+        Path to the cached MP3, or None on a cache miss
+    """
+    cached = get_cache_dir() / f"{key}.mp3"
+    if not cached.exists():
+        return None
+    _touch(key, cached.stat().st_size)
+    return cached
+
+
+def cache_store(key: str, source_path: str) -> Path:
+    """
+    Store a generated file in the cache.
+
+    The file is copied to a temporary name and atomically renamed
+    into place so concurrent runs never see a partial entry.
+
+    Args:
+        key: Cache key from cache_key()
+        source_path: Path to the generated MP3
+
+    Returns:
+        Path to the cached copy
+    """
+    cache_dir = get_cache_dir()
+    target = cache_dir / f"{key}.mp3"
+
+    fd, tmp_path = tempfile.mkstemp(suffix=".mp3", dir=cache_dir)
+    os.close(fd)
+    try:
+        shutil.copy(source_path, tmp_path)
+        os.replace(tmp_path, target)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    _touch(key, target.stat().st_size)
+    _evict_lru()
+    return target
+
+
+def cache_retrieve(key: str, destination: str) -> Optional[str]:
+    """
+    Copy a cached generation to the given destination path.
+
+    Args:
+        key: Cache key from cache_key()
+        destination: Path to copy the cached file to
+
+    Returns:
+        The destination path on a hit, None on a miss
+    """
+    cached = cache_lookup(key)
+    if cached is None:
+        return None
+
+    Path(destination).parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy(cached, destination)
+    return destination
@@ -12,15 +12,10 @@ from typing import Optional
 import typer
 from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
-from rich.prompt import Prompt, IntPrompt
-from rich.text import Text
-from rich import box
 
 from . import __version__
-from .core import AmbienceGenerator, GenerationConfig, list_available_moods
-from .presets import PRESETS, get_preset, list_presets
-from .providers import list_providers
+from .core import AmbienceGenerator, GenerationConfig
+from .presets import PRESETS, get_preset
 from .audio_utils import check_ffmpeg_installed
 
 # Initialize CLI app
@@ -50,10 +45,18 @@ BANNER = """
 [dim italic]AI-powered soundscapes for deep focus[/dim italic]
 """
 
+# Rendered once at import; the version never changes mid-process
+_BANNER_RENDERED = BANNER.format(version=__version__)
+
+# Presets are import-time static; snapshot the iteration orders so
+# hot CLI paths don't rebuild them per command
+_PRESET_NAMES = list(PRESETS.keys())
+_PRESET_ITEMS = list(PRESETS.items())
+
 
 def show_banner():
     """Display the FMAG banner."""
-    console.print(BANNER.format(version=__version__))
+    console.print(_BANNER_RENDERED)
 
 
 # ============================================================================
@@ -98,6 +101,11 @@ def generate(
         "--no-loop",
         help="Disable loop optimization"
     ),
+    precise: bool = typer.Option(
+        False,
+        "--precise",
+        help="Use slower two-pass EBU R128 loudness normalization"
+    ),
 ):
     """
     Generate ambient audio from a mood preset or custom prompt.
@@ -158,6 +166,7 @@ def generate(
         provider=provider,
         output_dir=output_dir,
         debug=debug,
+        normalize_mode="accurate" if precise else "fast",
         fade_in=0 if no_fade else 0.5,
         fade_out=0 if no_fade else 0.5,
         loop_optimize=not no_loop,
@@ -174,9 +183,10 @@ def generate(
                 console.print(f"[red]✗[/red] {error}")
             raise typer.Exit(1)
         
-        # Generate audio
+        # Generate audio (served from the on-disk cache when the same
+        # request was rendered before)
         output_path = generator.generate()
-        
+
         # Success message
         console.print()
         console.print(Panel(
@@ -199,8 +209,11 @@ def generate(
 @app.command()
 def moods():
     """List all available mood presets."""
+    from rich import box
+    from rich.table import Table
+
     show_banner()
-    
+
     table = Table(
         title="🎨 Available Mood Presets",
         box=box.ROUNDED,
@@ -211,7 +224,7 @@ def moods():
     table.add_column("Description", style="dim")
     table.add_column("Intensity", justify="center")
     
-    for name, preset in PRESETS.items():
+    for name, preset in _PRESET_ITEMS:
         table.add_row(
             f"{preset.emoji} {name}",
             preset.description,
@@ -229,8 +242,13 @@ def moods():
 @app.command()
 def providers():
     """List available audio providers."""
+    from rich import box
+    from rich.table import Table
+
+    from .providers import list_providers
+
     show_banner()
-    
+
     table = Table(
         title="🔌 Audio Providers",
         box=box.ROUNDED,
@@ -284,6 +302,10 @@ def interactive_mode() -> tuple[Optional[str], float, Optional[str]]:
     Returns:
         Tuple of (mood, duration, provider)
     """
+    from rich.prompt import IntPrompt, Prompt
+
+    from .providers import list_providers
+
     console.print(Panel(
         "[bold]Welcome to Interactive Mode![/bold]\n\n"
         "Let's create the perfect ambient soundscape for your focus session.",
@@ -295,7 +317,7 @@ def interactive_mode() -> tuple[Optional[str], float, Optional[str]]:
     # Mood selection
     console.print("[bold cyan]Step 1:[/bold cyan] Select a mood\n")
     
-    for i, (name, preset) in enumerate(PRESETS.items(), 1):
+    for i, (name, preset) in enumerate(_PRESET_ITEMS, 1):
         console.print(f"  [bold]{i}.[/bold] {preset.emoji} {name}")
         console.print(f"     [dim]{preset.description}[/dim]")
     console.print(f"  [bold]{len(PRESETS) + 1}.[/bold] 🎵 Custom prompt")
@@ -310,7 +332,7 @@ def interactive_mode() -> tuple[Optional[str], float, Optional[str]]:
     if mood_choice == len(PRESETS) + 1:
         mood = Prompt.ask("Enter custom prompt")
     else:
-        mood = list(PRESETS.keys())[mood_choice - 1]
+        mood = _PRESET_NAMES[mood_choice - 1]
     
     console.print()
     
@@ -400,6 +422,7 @@ def callback(
                 debug=False,
                 no_fade=False,
                 no_loop=False,
+                precise=False,
             )
 
 
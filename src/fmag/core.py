@@ -5,25 +5,72 @@ Orchestrates the generation pipeline: preset loading, provider
 selection, audio generation, and post-processing.
 """
 
+import asyncio
+import hashlib
 import os
+import shutil
+import threading
+import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 
-from .presets import get_preset, MoodPreset, PRESETS
-from .audio_utils import AudioProcessor
+from .presets import get_preset, MoodPreset, _MOOD_LIST
+from .audio_utils import AudioProcessor, scratch_dir
+from .cache import cache_key, cache_retrieve, cache_store
 from .providers import get_provider, auto_detect_provider, AudioProvider
 from .providers.base import GenerationResult, ProviderError
 
 console = Console()
 
 
+def _content_tag(
+    prompt: str,
+    duration_minutes: float,
+    provider_name: str,
+    settings: dict
+) -> str:
+    """Short deterministic tag identifying a generation request.
+
+    Identical requests map to identical filenames, so downstream
+    consumers (players, browsers, object stores) can cache by path.
+    The processing settings are folded in so rerunning a mood with
+    different flags (e.g. --no-fade) gets its own file instead of the
+    stale one at the old path.
+    """
+    extra = "|".join(f"{k}={v}" for k, v in sorted(settings.items()))
+    digest = hashlib.blake2b(
+        f"{prompt}|{duration_minutes}|{provider_name}|{extra}".encode(),
+        digest_size=6
+    )
+    return digest.hexdigest()
+
+
+def _timestamp() -> str:
+    """Compact filename timestamp via direct attribute reads.
+
+    Avoids re-parsing a strftime format string on every generation.
+    """
+    n = datetime.now()
+    return (
+        f"{n.year:04d}{n.month:02d}{n.day:02d}_"
+        f"{n.hour:02d}{n.minute:02d}{n.second:02d}"
+    )
+
+
 class GenerationConfig:
     """Configuration for ambience generation."""
-    
+
+    # Configs are plain attribute bags created per request; slots
+    # drop the per-instance __dict__ and its ~300 bytes
+    __slots__ = (
+        "mood", "duration_minutes", "provider", "output_dir", "debug",
+        "normalize", "normalize_mode", "fade_in", "fade_out",
+        "loop_optimize", "crossfade",
+    )
+
     def __init__(
         self,
         mood: str,
@@ -32,6 +79,7 @@ class GenerationConfig:
         output_dir: str = "./output",
         debug: bool = False,
         normalize: bool = True,
+        normalize_mode: str = "fast",
         fade_in: float = 0.5,
         fade_out: float = 0.5,
         loop_optimize: bool = True,
@@ -47,6 +95,7 @@ class GenerationConfig:
             output_dir: Output directory for generated files
             debug: Enable debug logging
             normalize: Normalize audio volume
+            normalize_mode: "fast" (dynaudnorm) or "accurate" (loudnorm)
             fade_in: Fade-in duration in seconds
             fade_out: Fade-out duration in seconds
             loop_optimize: Enable loop optimization
@@ -56,8 +105,11 @@ class GenerationConfig:
         self.duration_minutes = max(1.0, min(5.0, duration_minutes))
         self.provider = provider
         self.output_dir = output_dir
+        # Created once here so repeated generate() calls skip the stat
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
         self.debug = debug
         self.normalize = normalize
+        self.normalize_mode = normalize_mode
         self.fade_in = fade_in
         self.fade_out = fade_out
         self.loop_optimize = loop_optimize
@@ -85,7 +137,8 @@ class AmbienceGenerator:
             config: Generation configuration
         """
         self.config = config
-        self.console = Console()
+        # Console construction probes the terminal; share the module one
+        self.console = console
         
         # Initialize provider
         if config.provider:
@@ -95,6 +148,18 @@ class AmbienceGenerator:
         
         # Initialize audio processor
         self._processor = AudioProcessor(debug=config.debug)
+
+        # Progress rendering is pure overhead when stdout is a pipe
+        # (CI, server logs): skip the ANSI machinery entirely there
+        self._use_progress = self.console.is_terminal
+
+        # Warm the provider in the background so model/session setup
+        # overlaps validation and any interactive prompts; generation
+        # joins this thread before its first provider call
+        self._warmup = threading.Thread(
+            target=self._provider.warmup, daemon=True
+        )
+        self._warmup.start()
     
     @property
     def provider(self) -> AudioProvider:
@@ -115,7 +180,7 @@ class AmbienceGenerator:
         # Get preset or use custom prompt
         preset = get_preset(self.config.mood)
         if preset:
-            prompt = preset.to_prompt()
+            prompt = preset.to_prompt_for(self._provider.name)
             mood_name = preset.name
             mood_emoji = preset.emoji
         else:
@@ -124,58 +189,266 @@ class AmbienceGenerator:
             mood_name = "custom"
             mood_emoji = "🎵"
         
-        # Generate output filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_filename = f"fmag-{mood_name}-{timestamp}.mp3"
+        # Content-hashed filename: identical requests share a path
+        tag = _content_tag(
+            prompt, self.config.duration_minutes, self._provider.name,
+            self._pipeline_settings()
+        )
+        output_filename = f"fmag-{mood_name}-{tag}.mp3"
         output_path = os.path.join(self.config.output_dir, output_filename)
-        
-        # Ensure output directory exists
-        Path(self.config.output_dir).mkdir(parents=True, exist_ok=True)
-        
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            console=self.console,
-            transient=True,
-        ) as progress:
-            # Step 1: Generate raw audio
-            task = progress.add_task(
-                f"[cyan]{mood_emoji} Generating audio with {self._provider.name}...",
-                total=100
+
+        # A finished file at the deterministic path means this exact
+        # request was already rendered into this output dir
+        if os.path.isfile(output_path) and os.path.getsize(output_path) > 0:
+            if self.config.debug:
+                self.console.print("[dim]Output exists, skipping generation[/dim]")
+            return output_path
+
+        # Serve identical requests from the on-disk cache; the key
+        # covers the prompt, provider, and all processing settings
+        key = self._cache_key(prompt)
+        cached_path = cache_retrieve(key, output_path)
+        if cached_path:
+            if self.config.debug:
+                self.console.print("[dim]Cache hit, skipping generation[/dim]")
+            return cached_path
+
+        if self._use_progress:
+            # Deferred: rich.progress is only needed on the TTY path
+            from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
+
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                console=self.console,
+                transient=True,
+            ) as progress:
+                task = progress.add_task(
+                    f"[cyan]{mood_emoji} Generating audio with {self._provider.name}...",
+                    total=100
+                )
+                processed_path = self._render(
+                    prompt, output_filename, output_path,
+                    update=lambda **kwargs: progress.update(task, **kwargs)
+                )
+        else:
+            processed_path = self._render(prompt, output_filename, output_path)
+
+        try:
+            cache_store(key, processed_path)
+        except OSError:
+            pass
+
+        return processed_path
+
+    def _render(
+        self,
+        prompt: str,
+        output_filename: str,
+        output_path: str,
+        update=None
+    ) -> str:
+        """
+        Generate raw audio and run it through post-processing.
+
+        Args:
+            prompt: Fully rendered generation prompt
+            output_filename: Basename for the staged intermediate
+            output_path: Final output path
+            update: Optional progress callback taking rich
+                ``Progress.update`` keyword arguments
+
+        Returns:
+            Path to the processed MP3 file
+        """
+        if update is None:
+            def update(**kwargs):
+                pass
+
+        self._warmup.join()
+
+        # Backends that can hand back raw PCM skip the WAV intermediate
+        # entirely: the samples go straight from memory into ffmpeg's
+        # stdin and only the final MP3 ever touches a filesystem
+        pcm = self._provider.generate_pcm(
+            prompt=prompt,
+            duration_seconds=self.config.duration_seconds
+        )
+        if pcm is not None:
+            frames, sample_rate = pcm
+            update(completed=50)
+            update(description="[cyan]🎛️  Processing audio...")
+            processed_path = self._processor.process_pcm_pipeline(
+                frames.tobytes(),
+                sample_rate,
+                frames.shape[1],
+                output_path,
+                **self._pipeline_settings()
             )
-            
+            update(completed=100)
+            return processed_path
+
+        # Stage the raw intermediate in a unique subdir of the
+        # (RAM-backed when possible) process-lifetime scratch dir,
+        # so only the final MP3 touches the output dir
+        tmpdir = os.path.join(scratch_dir(), uuid.uuid4().hex)
+        os.mkdir(tmpdir)
+        try:
             result = self._provider.generate_audio(
                 prompt=prompt,
                 duration_seconds=self.config.duration_seconds,
-                output_path=output_path
+                output_path=os.path.join(tmpdir, output_filename)
             )
-            progress.update(task, completed=50)
-            
-            # Step 2: Process audio
-            progress.update(task, description="[cyan]🎛️  Processing audio...")
-            
+            update(completed=50)
+            update(description="[cyan]🎛️  Processing audio...")
+
             processed_path = self._processor.process_full_pipeline(
                 input_path=result.audio_path,
                 output_path=output_path,
-                normalize=self.config.normalize,
-                fade_in=self.config.fade_in,
-                fade_out=self.config.fade_out,
-                loop_optimize=self.config.loop_optimize,
-                crossfade=self.config.crossfade
+                **self._pipeline_settings()
             )
-            progress.update(task, completed=100)
-        
-        # Clean up intermediate WAV file if it exists
-        wav_path = output_path.replace('.mp3', '.wav')
-        if os.path.exists(wav_path) and wav_path != processed_path:
-            try:
-                os.remove(wav_path)
-            except OSError:
-                pass
-        
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+        update(completed=100)
         return processed_path
+
+    def _cache_key(self, prompt: str) -> str:
+        """Cache key covering the prompt, provider, and settings."""
+        settings = self._pipeline_settings()
+        extra = "|".join(f"{k}={v}" for k, v in sorted(settings.items()))
+        return cache_key(
+            prompt,
+            self.config.duration_minutes,
+            self._provider.name,
+            extra=extra
+        )
     
+    def generate_batch(self, moods: list[str]) -> list[str]:
+        """
+        Generate ambient audio for several moods in one run.
+
+        Prompts are assembled up front and handed to the provider's
+        batch path in a single call, then post-processed concurrently.
+
+        Args:
+            moods: Mood preset names or custom prompts
+
+        Returns:
+            Paths to the generated MP3 files, in mood order
+
+        Raises:
+            ProviderError: If generation fails
+        """
+        if not moods:
+            return []
+
+        self._warmup.join()
+
+        prompts = []
+        output_paths = []
+        # One clock read per batch; the per-item index keeps names
+        # unique even when items land within the same second
+        timestamp = _timestamp()
+
+        for index, mood in enumerate(moods):
+            preset = get_preset(mood)
+            prompts.append(
+                preset.to_prompt_for(self._provider.name) if preset else mood
+            )
+            mood_name = preset.name if preset else "custom"
+            output_paths.append(os.path.join(
+                self.config.output_dir,
+                f"fmag-{mood_name}-{timestamp}_{index:03d}.mp3"
+            ))
+
+        tmpdir = os.path.join(scratch_dir(), uuid.uuid4().hex)
+        os.mkdir(tmpdir)
+        try:
+            raw_paths = [
+                os.path.join(tmpdir, os.path.basename(path))
+                for path in output_paths
+            ]
+
+            # Providers with a true batch dimension get one call;
+            # otherwise overlap per-item generation with post-processing
+            has_batch_override = (
+                type(self._provider).generate_audio_batch
+                is not AudioProvider.generate_audio_batch
+            )
+            if has_batch_override:
+                results = self._provider.generate_audio_batch(
+                    prompts=prompts,
+                    duration_seconds=self.config.duration_seconds,
+                    output_paths=raw_paths
+                )
+                return self._processor.process_batch(
+                    list(zip([r.audio_path for r in results], output_paths)),
+                    **self._pipeline_settings()
+                )
+
+            return asyncio.run(
+                self._generate_overlapped(prompts, raw_paths, output_paths)
+            )
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+    def _pipeline_settings(self) -> dict:
+        """Post-processing keyword arguments derived from the config."""
+        return {
+            "normalize": self.config.normalize,
+            "normalize_mode": self.config.normalize_mode,
+            "fade_in": self.config.fade_in,
+            "fade_out": self.config.fade_out,
+            "loop_optimize": self.config.loop_optimize,
+            "crossfade": self.config.crossfade,
+        }
+
+    async def _generate_overlapped(
+        self,
+        prompts: list[str],
+        raw_paths: list[str],
+        output_paths: list[str]
+    ) -> list[str]:
+        """
+        Pipeline generation and post-processing concurrently.
+
+        A producer task generates each item in a worker thread and
+        queues the result; a consumer task post-processes completed
+        items while the next one is still generating, so the ffmpeg
+        CPU work overlaps provider inference.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        outputs: list = [None] * len(prompts)
+        settings = self._pipeline_settings()
+
+        async def produce():
+            for index, (prompt, raw_path) in enumerate(zip(prompts, raw_paths)):
+                result = await asyncio.to_thread(
+                    self._provider.generate_audio,
+                    prompt=prompt,
+                    duration_seconds=self.config.duration_seconds,
+                    output_path=raw_path
+                )
+                await queue.put((index, result))
+            await queue.put(None)
+
+        async def consume():
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                index, result = item
+                outputs[index] = await asyncio.to_thread(
+                    self._processor.process_full_pipeline,
+                    input_path=result.audio_path,
+                    output_path=output_paths[index],
+                    **settings
+                )
+
+        await asyncio.gather(produce(), consume())
+        return outputs
+
     def validate(self) -> list[str]:
         """
         Validate the configuration before generation.
@@ -199,16 +472,126 @@ class AmbienceGenerator:
         elif self.config.duration_minutes > 5:
             errors.append("Duration cannot exceed 5 minutes.")
         
-        # Check provider
-        if not self._provider.is_available():
+        # Check provider (memoized; interactive mode may validate often)
+        if not self._provider.availability():
             errors.append(
                 f"Provider '{self._provider.name}' is not available.\n"
-                f"{self._provider.get_config_help()}"
+                f"{self._provider.config_help()}"
             )
         
         return errors
 
 
+class GenerationService:
+    """
+    Request-coalescing front end for server-style embedding.
+
+    Concurrent ``submit`` calls within a short gather window are
+    batched into one ``generate_batch`` run, so they share a single
+    cached :class:`AmbienceGenerator` (and its provider, whose model
+    load can dominate end-to-end latency) and fill the provider's
+    batch dimension instead of running back-to-back.
+    """
+
+    def __init__(
+        self,
+        provider: Optional[str] = None,
+        output_dir: str = "./output",
+        debug: bool = False,
+        max_batch: int = 4,
+        gather_window: float = 0.075,
+    ):
+        """
+        Initialize the generation service.
+
+        Args:
+            provider: Provider name or None for auto-detect
+            output_dir: Output directory for generated files
+            debug: Enable debug logging
+            max_batch: Maximum requests coalesced into one batch
+            gather_window: Seconds to wait for more requests to arrive
+        """
+        self._provider_name = provider
+        self._output_dir = output_dir
+        self._debug = debug
+        self._max_batch = max_batch
+        self._gather_window = gather_window
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+        # One generator per duration; provider/debug are fixed per service
+        self._generators: dict[float, AmbienceGenerator] = {}
+
+    def _generator(self, duration_minutes: float) -> AmbienceGenerator:
+        """Get (or lazily build) the cached generator for a duration."""
+        generator = self._generators.get(duration_minutes)
+        if generator is None:
+            config = GenerationConfig(
+                mood="",
+                duration_minutes=duration_minutes,
+                provider=self._provider_name,
+                output_dir=self._output_dir,
+                debug=self._debug,
+            )
+            generator = AmbienceGenerator(config)
+            self._generators[duration_minutes] = generator
+        return generator
+
+    async def submit(self, mood: str, duration_minutes: float = 2.0) -> str:
+        """
+        Submit a generation request and await its output path.
+
+        Args:
+            mood: Mood preset name or custom prompt
+            duration_minutes: Duration in minutes
+
+        Returns:
+            Path to the generated MP3 file
+        """
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((mood, duration_minutes, future))
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._drain())
+        return await future
+
+    async def _drain(self) -> None:
+        """Gather queued requests into batches and run them."""
+        loop = asyncio.get_running_loop()
+        while not self._queue.empty():
+            batch = [self._queue.get_nowait()]
+            deadline = loop.time() + self._gather_window
+            while len(batch) < self._max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            # Items sharing a duration can share one provider batch call
+            groups: dict[float, list] = {}
+            for mood, duration_minutes, future in batch:
+                groups.setdefault(duration_minutes, []).append((mood, future))
+
+            for duration_minutes, items in groups.items():
+                generator = self._generator(duration_minutes)
+                moods = [mood for mood, _ in items]
+                try:
+                    paths = await asyncio.to_thread(
+                        generator.generate_batch, moods
+                    )
+                except Exception as exc:
+                    for _, future in items:
+                        if not future.done():
+                            future.set_exception(exc)
+                else:
+                    for (_, future), path in zip(items, paths):
+                        if not future.done():
+                            future.set_result(path)
+
+
 def quick_generate(
     mood: str,
     duration_minutes: float = 2.0,
@@ -218,38 +601,39 @@ def quick_generate(
 ) -> str:
     """
     Quick helper function for simple generation.
-    
+
     Args:
-        mood: Mood preset name
+        mood: Mood preset name, or a list of moods for batch generation
         duration_minutes: Duration in minutes
         provider: Provider name (optional)
         output_dir: Output directory
         debug: Enable debug mode
-    
+
     Returns:
-        Path to generated MP3 file
+        Path to generated MP3 file (list of paths for batch input)
     """
+    batch = isinstance(mood, (list, tuple))
     config = GenerationConfig(
-        mood=mood,
+        mood=mood[0] if batch else mood,
         duration_minutes=duration_minutes,
         provider=provider,
         output_dir=output_dir,
         debug=debug
     )
-    
+
     generator = AmbienceGenerator(config)
+    if batch:
+        return generator.generate_batch(list(mood))
     return generator.generate()
 
 
-def list_available_moods() -> list[tuple[str, str, str]]:
+def list_available_moods() -> tuple[tuple[str, str, str], ...]:
     """
     List all available moods with their descriptions.
-    
+
     Returns:
-        List of (name, emoji, description) tuples
+        Tuple of (name, emoji, description) tuples, precomputed at
+        import since the preset library is static
     """
-    return [
-        (name, preset.emoji, preset.description)
-        for name, preset in PRESETS.items()
-    ]
+    return _MOOD_LIST
 
@@ -5,14 +5,28 @@ Each preset contains a carefully crafted description and generation hints
 to produce the perfect focus-enhancing soundscape.
 """
 
+import functools
+import re
 from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True)
 class MoodPreset:
-    """A mood preset for ambience generation."""
-    
+    """A mood preset for ambience generation.
+
+    Frozen and slotted: presets are immutable library data, and
+    skipping the per-instance ``__dict__`` keeps attribute reads on
+    the prompt hot path at C-level descriptor speed. ``__slots__`` is
+    spelled out by hand because ``dataclass(slots=True)`` needs a
+    newer Python than this package supports.
+    """
+
+    __slots__ = (
+        "name", "description", "style_hints", "suggested_tempo",
+        "intensity", "elements", "color", "emoji", "_prompt",
+    )
+
     name: str
     description: str
     style_hints: str
@@ -22,17 +36,65 @@ class MoodPreset:
     color: str  # For Rich terminal styling
     emoji: str
     
+    def __post_init__(self):
+        # Presets are immutable, so the prompt is rendered exactly
+        # once at construction; to_prompt() is then a plain attribute
+        # read and byte-identical across calls
+        object.__setattr__(self, "_prompt", self._build_prompt())
+
     def to_prompt(self) -> str:
         """Convert preset to a generation prompt."""
+        return self._prompt
+
+    # Invariant instruction prefix, kept first and byte-identical
+    # across presets so provider-side prompt prefix caches hit on
+    # every call; only the scene details after the divider vary
+    PROMPT_PREFIX = (
+        "You are an ambient soundscape generator. "
+        "Create a seamless, loop-friendly ambient soundscape suitable "
+        "for continuous background playback during focus sessions.\n"
+        "---\n"
+    )
+
+    def _build_prompt(self) -> str:
+        """Assemble the prompt string from the preset fields."""
         elements_str = ", ".join(self.elements)
         return (
-            f"{self.description}. "
+            f"{self.PROMPT_PREFIX}"
+            f"Scene: {self.description}. "
             f"Style: {self.style_hints}. "
             f"Key elements: {elements_str}. "
-            f"Tempo: {self.suggested_tempo}. "
-            f"Create a seamless, loop-friendly ambient soundscape."
+            f"Tempo: {self.suggested_tempo}."
         )
 
+    def to_prompt_for(self, provider_name: str) -> str:
+        """
+        Convert preset to a prompt shaped for a specific provider.
+
+        Library presets resolve to a single dict lookup; all the
+        string assembly happened once at import time.
+        """
+        cached = _PROMPT_BY_PROVIDER.get((self.name, provider_name))
+        if cached is not None:
+            return cached
+        return self._build_prompt_for(provider_name)
+
+    def _build_prompt_for(self, provider_name: str) -> str:
+        """Assemble a provider-flavored prompt string.
+
+        AudioGen responds best to the structured descriptive format;
+        Bark prefers [music]-tagged free phrasing.
+        """
+        if provider_name == "bark":
+            elements_str = ", ".join(self.elements)
+            return (
+                f"{self.PROMPT_PREFIX}"
+                f"[music] {self.description}, {self.style_hints}, "
+                f"{self.suggested_tempo} tempo, "
+                f"featuring {elements_str} [music]"
+            )
+        return self._build_prompt()
+
 
 # =============================================================================
 # PRESET LIBRARY
@@ -131,9 +193,43 @@ PRESETS: dict[str, MoodPreset] = {
 }
 
 
+# Derived lookups built once at import; the preset library never
+# changes at runtime
+_PROMPT_BY_PROVIDER: dict[tuple[str, str], str] = {
+    (name, provider): preset._build_prompt_for(provider)
+    for name, preset in PRESETS.items()
+    for provider in ("audiogen", "bark")
+}
+
+_MOOD_LIST: tuple[tuple[str, str, str], ...] = tuple(
+    (name, preset.emoji, preset.description)
+    for name, preset in PRESETS.items()
+)
+
+_PRESET_CHOICES: tuple[tuple[str, str], ...] = tuple(
+    (f"{preset.emoji} {name}", name)
+    for name, preset in PRESETS.items()
+)
+
+
+# Case/punctuation-insensitive lookup: "Calm-Rain-Office" should hit
+# the calm_rain_office preset (and its caches), not fall through to a
+# full custom-prompt generation
+_NORMALIZED: dict[str, MoodPreset] = {
+    re.sub(r"[^a-z0-9]", "", name.lower()): preset
+    for name, preset in PRESETS.items()
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_name(name: str) -> str:
+    """Strip case and punctuation from a preset name for lookup."""
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
 def get_preset(name: str) -> Optional[MoodPreset]:
-    """Get a preset by name."""
-    return PRESETS.get(name)
+    """Get a preset by name (case- and punctuation-insensitive)."""
+    return PRESETS.get(name) or _NORMALIZED.get(_normalize_name(name))
 
 
 def list_presets() -> list[str]:
@@ -143,8 +239,5 @@ def list_presets() -> list[str]:
 
 def get_preset_choices() -> list[tuple[str, str]]:
     """Get preset choices formatted for CLI menus."""
-    return [
-        (f"{preset.emoji} {name}", name) 
-        for name, preset in PRESETS.items()
-    ]
+    return list(_PRESET_CHOICES)
 
@@ -4,9 +4,12 @@ Audio generation providers for FMAG.
 Supports multiple AI audio generation backends with a unified interface.
 """
 
-from .base import AudioProvider, ProviderError
-from .audiogen_provider import AudioGenProvider
-from .bark_provider import BarkProvider
+import importlib
+import importlib.util
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+from .base import AudioProvider, ProviderError, _get_console
 
 __all__ = [
     "AudioProvider",
@@ -18,73 +21,100 @@ __all__ = [
 ]
 
 
-# Registry of available providers
-PROVIDERS = {
-    "audiogen": AudioGenProvider,
-    "bark": BarkProvider,
-}
+# Registry of available providers, imported on demand: backend modules
+# can drag in heavyweight ML stacks, and most commands never need them.
+# Read-only so concurrent users (the batching service) can rely on it.
+_PROVIDER_MODULES: Mapping[str, tuple[str, str]] = MappingProxyType({
+    "audiogen": ("fmag.providers.audiogen_provider", "AudioGenProvider"),
+    "bark": ("fmag.providers.bark_provider", "BarkProvider"),
+})
+
+_PROVIDER_NAMES = tuple(_PROVIDER_MODULES)
+_AVAILABLE_MSG = ", ".join(_PROVIDER_NAMES)
+
+
+def __getattr__(name: str):
+    """Lazily expose provider classes (PEP 562)."""
+    for module_name, class_name in _PROVIDER_MODULES.values():
+        if name == class_name:
+            return getattr(importlib.import_module(module_name), class_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _provider_class(name: str) -> type:
+    """Import and return the provider class for a registry name."""
+    module_name, class_name = _PROVIDER_MODULES[name]
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 def get_provider(name: str, debug: bool = False) -> AudioProvider:
     """
     Get a provider instance by name.
-    
+
     Args:
         name: Provider name ('audiogen' or 'bark')
         debug: Enable debug logging
-    
+
     Returns:
         Configured provider instance
-    
+
     Raises:
         ValueError: If provider name is unknown
     """
-    if name not in PROVIDERS:
-        available = ", ".join(PROVIDERS.keys())
+    if name not in _PROVIDER_MODULES:
         raise ValueError(
-            f"Unknown provider '{name}'. Available: {available}"
+            f"Unknown provider '{name}'. Available: {_AVAILABLE_MSG}"
         )
-    
-    return PROVIDERS[name](debug=debug)
 
+    return _provider_class(name)(debug=debug)
 
-def list_providers() -> list[str]:
+
+def list_providers() -> tuple[str, ...]:
     """List all available provider names."""
-    return list(PROVIDERS.keys())
+    return _PROVIDER_NAMES
+
+
+# Detection result memoized per process: environment variables and
+# installed packages don't change mid-run, so the probes fire once
+_detected_name: Optional[str] = None
+
+
+def _detect_provider_name(debug: bool = False) -> str:
+    """Run the detection probes and return the winning provider name."""
+    import os
+
+    # Check for OpenAI API key (AudioGen)
+    if os.environ.get("OPENAI_API_KEY"):
+        if debug:
+            _get_console().print("[dim]Auto-detected: AudioGen (OpenAI)[/dim]")
+        return "audiogen"
+
+    # Check for Bark without importing it
+    if importlib.util.find_spec("bark") is not None:
+        if debug:
+            _get_console().print("[dim]Auto-detected: Bark[/dim]")
+        return "bark"
+
+    # Default to AudioGen (will fail gracefully if not configured)
+    return "audiogen"
 
 
 def auto_detect_provider(debug: bool = False) -> AudioProvider:
     """
     Auto-detect the best available provider based on environment.
-    
+
     Checks for API keys and installed dependencies to determine
-    which provider to use.
-    
+    which provider to use, importing only the chosen backend. The
+    detection itself runs once per process; later calls reuse the
+    answer and only construct a fresh instance.
+
     Args:
         debug: Enable debug logging
-    
+
     Returns:
         The best available provider instance
     """
-    import os
-    
-    # Check for OpenAI API key (AudioGen)
-    if os.environ.get("OPENAI_API_KEY"):
-        if debug:
-            from rich.console import Console
-            Console().print("[dim]Auto-detected: AudioGen (OpenAI)[/dim]")
-        return AudioGenProvider(debug=debug)
-    
-    # Check for Bark
-    try:
-        import bark
-        if debug:
-            from rich.console import Console
-            Console().print("[dim]Auto-detected: Bark[/dim]")
-        return BarkProvider(debug=debug)
-    except ImportError:
-        pass
-    
-    # Default to AudioGen (will fail gracefully if not configured)
-    return AudioGenProvider(debug=debug)
-
+    global _detected_name
+    if _detected_name is None:
+        _detected_name = _detect_provider_name(debug)
+    return _provider_class(_detected_name)(debug=debug)
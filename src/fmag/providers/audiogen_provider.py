@@ -7,16 +7,97 @@ so this provider generates synthesized ambient audio for demonstration.
 In production, you would integrate with the actual API when available.
 """
 
+import functools
+import hashlib
 import os
-import struct
 import math
 import random
+import re
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
+from ..cache import get_cache_dir
 from .base import AudioProvider, GenerationResult, ProviderError
 
 
+# One full turn in radians, hoisted so the generators' angular
+# frequencies are plain constant folds instead of repeated
+# 2 * math.pi expressions at every call site.
+_TAU = 2 * math.pi
+
+
+@functools.lru_cache(maxsize=64)
+def _sine_second(freq: int, sample_rate: int) -> "np.ndarray":
+    """One cached second of a sine at an integer frequency.
+
+    An integer frequency completes whole cycles per second, so the
+    block tiles seamlessly. Accumulating phase from a small per-second
+    table is also more accurate than evaluating sin on a float32 time
+    vector whose phase grows into the millions of radians.
+    """
+    i = np.arange(sample_rate, dtype=np.float32)
+    return np.sin(i * np.float32(_TAU * freq / sample_rate))
+
+
+def _sine_wave(freq: int, sample_rate: int, n: int) -> "np.ndarray":
+    """n samples of a fixed-frequency sine, tiled from the cached second."""
+    return np.resize(_sine_second(freq, sample_rate), n)
+
+
+def _cycle_phase(t: "np.ndarray", cycle: float) -> "np.ndarray":
+    """Normalized [0, 1) phase of t within a repeating cycle.
+
+    One multiply plus one mod over the shared time vector; generators
+    compute each rhythm's phase once and reuse the array across every
+    term that follows it.
+    """
+    return (t * np.float32(1.0 / cycle)) % np.float32(1.0)
+
+
+# Worker pool for noise-buffer shaping. The FFT and cumsum kernels
+# release the GIL, so shaping the big noise buffers overlaps with the
+# oscillator math on the main thread. Random base draws stay on the
+# calling thread to keep seeded generation deterministic.
+_NOISE_POOL = ThreadPoolExecutor(max_workers=3)
+
+
+# Per-thread reusable output buffer for quantized frames. Renders on
+# the same thread are sequential and consumers copy or serialize the
+# frames before the next render starts, so one buffer per thread that
+# grows to the largest request removes the per-render allocation.
+_INTERLEAVE_SCRATCH = threading.local()
+
+
+def _interleave_scratch(n: int) -> "np.ndarray":
+    """Get an (n, 2) int16 slice of the thread's scratch buffer."""
+    buf = getattr(_INTERLEAVE_SCRATCH, "buf", None)
+    if buf is None or len(buf) < n:
+        buf = np.empty((n, 2), dtype="<i2")
+        _INTERLEAVE_SCRATCH.buf = buf
+    return buf[:n]
+
+
+# Mood detection rules, checked in order: a rule matches when every
+# word in its first set and at least one word from its second set
+# (when non-empty) appear in the prompt. Keeping the keywords in one
+# table makes adding a mood a one-line change.
+_MOOD_RULES: tuple[tuple[frozenset, frozenset, str], ...] = (
+    (frozenset({"rain", "office"}), frozenset(), "calm_rain_office"),
+    (frozenset({"forest", "cafe"}), frozenset(), "forest_cafe"),
+    (frozenset(), frozenset({"space", "spaceship", "spacecraft"}),
+     "deep_focus_spaceship"),
+    (frozenset(), frozenset({"ocean", "wave", "waves", "beach"}),
+     "ocean_meditation"),
+    (frozenset(), frozenset({"lofi", "coding", "night"}),
+     "night_coding_lofi"),
+)
+
+
 class AudioGenProvider(AudioProvider):
     """
     Audio generation provider using OpenAI-style APIs.
@@ -33,6 +114,9 @@ class AudioGenProvider(AudioProvider):
         super().__init__(debug)
         self.api_key = os.environ.get("OPENAI_API_KEY")
         self._sample_rate = 44100
+        # Reseeded from the prompt for each render; PCG64 batch draws
+        # replace the legacy global RandomState
+        self._rng = np.random.default_rng()
     
     def is_available(self) -> bool:
         """Check if OpenAI API key is configured."""
@@ -65,19 +149,34 @@ class AudioGenProvider(AudioProvider):
             # Detect which mood preset this is
             mood_type = self._detect_mood_type(prompt)
             self.log(f"Detected mood type: {mood_type}")
-            
-            # Generate mood-specific audio
-            audio_data = self._generate_mood_audio(
-                mood_type=mood_type,
-                duration=duration_seconds,
-                sample_rate=self._sample_rate
-            )
-            
+
+            seed = self._seed_for(prompt, kwargs.get("seed"))
+
             Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            
-            wav_path = output_path.replace('.mp3', '.wav')
-            self._write_wav(wav_path, audio_data, sample_rate=self._sample_rate)
-            
+            wav_path = str(Path(output_path).with_suffix('.wav'))
+
+            cached_path = self._soundscape_cache_path(
+                mood_type, duration_seconds, seed
+            )
+            if cached_path.is_file() and cached_path.stat().st_size > 0:
+                self.log("Soundscape cache hit, skipping synthesis")
+                shutil.copy(cached_path, wav_path)
+            else:
+                random.seed(seed)
+                self._rng = np.random.default_rng(seed)
+
+                # Generate mood-specific audio
+                audio_data = self._generate_mood_audio(
+                    mood_type=mood_type,
+                    duration=duration_seconds,
+                    sample_rate=self._sample_rate
+                )
+
+                self._write_wav(
+                    wav_path, audio_data, sample_rate=self._sample_rate
+                )
+                self._store_soundscape(wav_path, cached_path)
+
             self.log(f"Audio saved to: {wav_path}")
             
             return GenerationResult(
@@ -95,30 +194,134 @@ class AudioGenProvider(AudioProvider):
             
         except Exception as e:
             raise ProviderError(f"AudioGen generation failed: {e}")
-    
+
+    def generate_pcm(
+        self,
+        prompt: str,
+        duration_seconds: float,
+        **kwargs
+    ) -> tuple:
+        """
+        Synthesize the soundscape and return the int16 frames directly.
+
+        Serves the in-memory post-processing path: no scratch WAV is
+        materialized just to be decoded again moments later. The
+        soundscape cache is still consulted and populated, so repeated
+        identical requests stay nearly free.
+        """
+        self.log(f"Generating {duration_seconds}s of PCM...")
+
+        try:
+            mood_type = self._detect_mood_type(prompt)
+            self.log(f"Detected mood type: {mood_type}")
+
+            seed = self._seed_for(prompt, kwargs.get("seed"))
+            cached_path = self._soundscape_cache_path(
+                mood_type, duration_seconds, seed
+            )
+            if cached_path.is_file() and cached_path.stat().st_size > 0:
+                self.log("Soundscape cache hit, skipping synthesis")
+                return self._read_wav_frames(cached_path), self._sample_rate
+
+            random.seed(seed)
+            self._rng = np.random.default_rng(seed)
+
+            audio_data = self._generate_mood_audio(
+                mood_type=mood_type,
+                duration=duration_seconds,
+                sample_rate=self._sample_rate
+            )
+            self._store_soundscape_frames(audio_data, cached_path)
+            return audio_data, self._sample_rate
+
+        except Exception as e:
+            raise ProviderError(f"AudioGen generation failed: {e}")
+
+    def _seed_for(self, prompt: str, seed: Optional[int]) -> int:
+        """Deterministic seed (from the prompt unless supplied).
+
+        Identical requests then synthesize bit-identical audio, which
+        makes the on-disk soundscape cache sound.
+        """
+        if seed is not None:
+            return seed
+        return int.from_bytes(
+            hashlib.blake2b(prompt.encode(), digest_size=8).digest(),
+            "little"
+        )
+
+    def _soundscape_cache_path(
+        self,
+        mood_type: str,
+        duration_seconds: float,
+        seed: int
+    ) -> Path:
+        """Cache location for a deterministic soundscape request."""
+        key = hashlib.blake2b(
+            f"{mood_type}|{duration_seconds}|{self._sample_rate}|{seed}".encode(),
+            digest_size=16
+        ).hexdigest()
+        return Path(get_cache_dir()) / "audiogen" / f"{key}.wav"
+
+    def _store_soundscape(self, wav_path: str, cached_path: Path) -> None:
+        """Keep a rendered soundscape for future identical requests.
+
+        Hard-links when the cache shares a filesystem with the scratch
+        area, otherwise copies via a temp file and atomic replace.
+        """
+        try:
+            cached_path.parent.mkdir(parents=True, exist_ok=True)
+            os.link(wav_path, cached_path)
+        except OSError:
+            try:
+                tmp_path = f"{cached_path}.tmp"
+                shutil.copy(wav_path, tmp_path)
+                os.replace(tmp_path, cached_path)
+            except OSError:
+                pass
+
+    def _store_soundscape_frames(
+        self,
+        audio_data: "np.ndarray",
+        cached_path: Path
+    ) -> None:
+        """Cache synthesized frames as a WAV without a scratch copy."""
+        try:
+            cached_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = f"{cached_path}.tmp"
+            self._write_wav(tmp_path, audio_data, sample_rate=self._sample_rate)
+            os.replace(tmp_path, cached_path)
+        except OSError:
+            pass
+
+    def _read_wav_frames(self, path: Path) -> "np.ndarray":
+        """Read a cached WAV back into interleaved int16 frames."""
+        import wave
+
+        with wave.open(str(path), 'rb') as wav_file:
+            raw = wav_file.readframes(wav_file.getnframes())
+            channels = wav_file.getnchannels()
+        return np.frombuffer(raw, dtype="<i2").reshape(-1, channels)
+
     def _detect_mood_type(self, prompt: str) -> str:
-        """Detect the mood type from the prompt."""
-        prompt_lower = prompt.lower()
-        
-        if "rain" in prompt_lower and "office" in prompt_lower:
-            return "calm_rain_office"
-        elif "forest" in prompt_lower and "cafe" in prompt_lower:
-            return "forest_cafe"
-        elif "space" in prompt_lower or "spaceship" in prompt_lower:
-            return "deep_focus_spaceship"
-        elif "ocean" in prompt_lower or "wave" in prompt_lower or "beach" in prompt_lower:
-            return "ocean_meditation"
-        elif "lofi" in prompt_lower or "coding" in prompt_lower or "night" in prompt_lower:
-            return "night_coding_lofi"
-        else:
-            return "ambient"
+        """Detect the mood type from the prompt.
+
+        One lowercase + tokenize pass, then set lookups against the
+        ``_MOOD_RULES`` table, instead of re-scanning the prompt
+        string once per keyword.
+        """
+        tokens = frozenset(re.findall(r"[a-z]+", prompt.lower()))
+        for all_of, any_of, mood in _MOOD_RULES:
+            if all_of <= tokens and (not any_of or tokens & any_of):
+                return mood
+        return "ambient"
     
     def _generate_mood_audio(
         self,
         mood_type: str,
         duration: float,
         sample_rate: int
-    ) -> bytes:
+    ) -> "np.ndarray":
         """Generate audio based on detected mood type."""
         
         generators = {
@@ -137,331 +340,350 @@ class AudioGenProvider(AudioProvider):
     # RAIN OFFICE - Gentle rain, thunder rumbles, cozy indoor atmosphere
     # =========================================================================
     
-    def _generate_rain_office(self, duration: float, sample_rate: int) -> bytes:
+    def _generate_rain_office(self, duration: float, sample_rate: int) -> "np.ndarray":
         """Generate calm rain on office window soundscape."""
         num_samples = int(duration * sample_rate)
-        left_channel = []
-        right_channel = []
-        
+        t = np.arange(num_samples, dtype=np.float32) / sample_rate
+
+        # Kick off the big noise buffers so their FFT shaping overlaps
+        # the oscillator math below
+        rain_fut = self._pink_noise_future(num_samples)
+        stereo_fut = self._pink_noise_future(num_samples)
+
         # Pre-generate some random thunder timing
         thunder_times = []
-        t = random.uniform(15, 30)
-        while t < duration:
-            thunder_times.append(t)
-            t += random.uniform(25, 45)
-        
-        for i in range(num_samples):
-            t = i / sample_rate
-            
-            # Rain on window - filtered pink noise with droplet texture
-            rain = self._pink_noise() * 0.25
-            
-            # Add individual droplet sounds
-            droplet_chance = 0.0001
-            if random.random() < droplet_chance:
-                rain += random.gauss(0, 0.3)
-            
-            # Heavier rain bursts (slow modulation)
-            rain_intensity = 0.7 + 0.3 * math.sin(t * 0.02)
-            rain *= rain_intensity
-            
-            # Distant thunder
-            thunder = 0.0
-            for thunder_time in thunder_times:
-                if thunder_time <= t < thunder_time + 4:
-                    thunder_t = t - thunder_time
-                    # Thunder envelope
-                    thunder_env = math.exp(-thunder_t * 0.8) * math.sin(thunder_t * 2)
-                    # Low rumble
-                    thunder += thunder_env * (
-                        math.sin(thunder_t * 25) * 0.3 +
-                        math.sin(thunder_t * 35) * 0.2 +
-                        self._pink_noise() * 0.15
-                    ) * 0.4
-            
-            # Subtle room tone / AC hum
-            room_tone = (
-                math.sin(t * 60 * 2 * math.pi) * 0.02 +
-                math.sin(t * 120 * 2 * math.pi) * 0.01
-            )
-            
-            # Combine
-            sample = rain + thunder + room_tone
-            
-            # Stereo spread - rain slightly different in each ear
-            left = sample + self._pink_noise() * 0.05
-            right = sample + self._pink_noise() * 0.05
-            
-            left_channel.append(max(-0.95, min(0.95, left)))
-            right_channel.append(max(-0.95, min(0.95, right)))
-        
-        return self._channels_to_bytes(left_channel, right_channel)
+        event_t = random.uniform(15, 30)
+        while event_t < duration:
+            thunder_times.append(event_t)
+            event_t += random.uniform(25, 45)
+
+        # Rain on window - pink noise with sparse droplet impulses
+        rain = rain_fut.result() * 0.25
+        droplets = self._rng.random(num_samples, dtype=np.float32) < 0.0001
+        rain[droplets] += 0.3 * self._rng.standard_normal(
+            int(droplets.sum()), dtype=np.float32
+        )
+
+        # Heavier rain bursts (slow modulation)
+        rain *= 0.7 + 0.3 * np.sin(t * 0.02)
+
+        # Distant thunder - each event only touches its own 4s slice
+        thunder = np.zeros(num_samples, dtype=np.float32)
+        for thunder_time in thunder_times:
+            start = int(thunder_time * sample_rate)
+            end = min(num_samples, start + 4 * sample_rate)
+            if start >= num_samples:
+                continue
+            thunder_t = t[start:end] - np.float32(thunder_time)
+            thunder_env = np.exp(-thunder_t * 0.8) * np.sin(thunder_t * 2)
+            thunder[start:end] += thunder_env * (
+                np.sin(thunder_t * 25) * 0.3 +
+                np.sin(thunder_t * 35) * 0.2 +
+                self._pink_noise_buffer(end - start) * 0.15
+            ) * 0.4
+
+        # Subtle room tone / AC hum
+        room_tone = (
+            _sine_wave(60, sample_rate, num_samples) * 0.02 +
+            _sine_wave(120, sample_rate, num_samples) * 0.01
+        )
+
+        # Combine
+        sample = rain + thunder + room_tone
+
+        # Stereo spread - one decorrelation buffer applied anti-phase
+        # gives the same width for half the noise work
+        stereo = stereo_fut.result() * 0.05
+        left = sample + stereo
+        right = sample - stereo
+
+        return self._interleave_channels(left, right)
     
     # =========================================================================
     # FOREST CAFE - Birds, breeze, distant cafe sounds, nature
     # =========================================================================
     
-    def _generate_forest_cafe(self, duration: float, sample_rate: int) -> bytes:
+    def _generate_forest_cafe(self, duration: float, sample_rate: int) -> "np.ndarray":
         """Generate forest cafe ambience."""
         num_samples = int(duration * sample_rate)
-        left_channel = []
-        right_channel = []
-        
+        t = np.arange(num_samples, dtype=np.float32) / sample_rate
+
+        # One brown buffer excites breeze, gusts and chatter under
+        # different envelopes (shared excitation, per-consumer
+        # shaping); it integrates on the pool while the bird and
+        # chime oscillators are computed here
+        brown_fut = self._brown_noise_future(num_samples)
+        stream_fut = self._pink_noise_future(num_samples)
+
         # Pre-generate bird chirp timings
         bird_events = []
-        t = random.uniform(2, 5)
-        while t < duration:
+        event_t = random.uniform(2, 5)
+        while event_t < duration:
             bird_events.append({
-                'time': t,
+                'time': event_t,
                 'freq': random.uniform(2000, 4000),
                 'duration': random.uniform(0.1, 0.3),
                 'pan': random.uniform(-0.7, 0.7)  # Left to right
             })
-            t += random.uniform(3, 8)
-        
+            event_t += random.uniform(3, 8)
+
         # Wind gust timings
         wind_gusts = []
-        t = random.uniform(5, 15)
-        while t < duration:
-            wind_gusts.append({'time': t, 'duration': random.uniform(2, 5)})
-            t += random.uniform(10, 25)
-        
-        for i in range(num_samples):
-            t = i / sample_rate
-            
-            # Gentle breeze through leaves - filtered noise with slow modulation
-            breeze_intensity = 0.5 + 0.3 * math.sin(t * 0.15) + 0.2 * math.sin(t * 0.08)
-            breeze = self._brown_noise() * 0.15 * breeze_intensity
-            
-            # Wind gusts
-            for gust in wind_gusts:
-                if gust['time'] <= t < gust['time'] + gust['duration']:
-                    gust_t = t - gust['time']
-                    gust_env = math.sin(gust_t / gust['duration'] * math.pi)
-                    breeze += self._brown_noise() * 0.2 * gust_env
-            
-            # Bird songs
-            birds = 0.0
-            bird_pan = 0.0
-            for bird in bird_events:
-                if bird['time'] <= t < bird['time'] + bird['duration']:
-                    bird_t = t - bird['time']
-                    # Chirp envelope
-                    env = math.sin(bird_t / bird['duration'] * math.pi)
-                    # Frequency modulation for realistic chirp
-                    freq_mod = bird['freq'] * (1 + 0.3 * math.sin(bird_t * 40))
-                    birds += math.sin(bird_t * freq_mod * 2 * math.pi) * env * 0.15
-                    bird_pan = bird['pan']
-            
-            # Distant cafe chatter - very low filtered noise bursts
-            chatter = 0.0
-            if random.random() < 0.3:
-                chatter = self._brown_noise() * 0.03
-            
-            # Trickling stream
-            stream = (
-                math.sin(t * 180 * 2 * math.pi) * 0.02 +
-                math.sin(t * 220 * 2 * math.pi) * 0.015 +
-                self._pink_noise() * 0.02
-            ) * (0.7 + 0.3 * math.sin(t * 0.5))
-            
-            # Wind chimes - occasional
-            chimes = 0.0
-            chime_trigger = math.sin(t * 0.1) > 0.95
-            if chime_trigger:
-                chime_freqs = [523, 659, 784, 880]  # C5, E5, G5, A5
-                for freq in chime_freqs:
-                    decay = math.exp(-(t % 3) * 2)
-                    chimes += math.sin(t * freq * 2 * math.pi) * decay * 0.02
-            
-            # Combine
-            sample = breeze + birds + chatter + stream + chimes
-            
-            # Stereo with bird panning
-            left = sample * 0.9 + birds * (0.5 - bird_pan * 0.5)
-            right = sample * 0.9 + birds * (0.5 + bird_pan * 0.5)
-            
-            left_channel.append(max(-0.95, min(0.95, left)))
-            right_channel.append(max(-0.95, min(0.95, right)))
-        
-        return self._channels_to_bytes(left_channel, right_channel)
+        event_t = random.uniform(5, 15)
+        while event_t < duration:
+            wind_gusts.append({'time': event_t, 'duration': random.uniform(2, 5)})
+            event_t += random.uniform(10, 25)
+
+        # Gentle breeze through leaves - filtered noise with slow modulation
+        breeze_intensity = (
+            0.5 + 0.3 * np.sin(t * 0.15) + 0.2 * np.sin(t * 0.08)
+        )
+        brown = brown_fut.result()
+        breeze = brown * (0.15 * breeze_intensity)
+
+        # Wind gusts - each event windows its slice of the shared
+        # brown buffer instead of integrating fresh noise
+        for gust in wind_gusts:
+            start = int(gust['time'] * sample_rate)
+            end = min(num_samples, start + int(gust['duration'] * sample_rate))
+            if start >= num_samples:
+                continue
+            gust_t = t[start:end] - np.float32(gust['time'])
+            gust_env = np.sin(gust_t / gust['duration'] * math.pi)
+            breeze[start:end] += brown[start:end] * (0.2 * gust_env)
+
+        # Bird songs, accumulated with per-event panning
+        birds = np.zeros(num_samples, dtype=np.float32)
+        birds_left = np.zeros(num_samples, dtype=np.float32)
+        birds_right = np.zeros(num_samples, dtype=np.float32)
+        for bird in bird_events:
+            start = int(bird['time'] * sample_rate)
+            end = min(num_samples, start + int(bird['duration'] * sample_rate))
+            if start >= num_samples:
+                continue
+            bird_t = t[start:end] - np.float32(bird['time'])
+            # Chirp envelope
+            env = np.sin(bird_t / bird['duration'] * math.pi)
+            # Frequency modulation for realistic chirp
+            freq_mod = bird['freq'] * (1 + 0.3 * np.sin(bird_t * 40))
+            chirp = np.sin(bird_t * freq_mod * _TAU) * env * 0.15
+            birds[start:end] += chirp
+            birds_left[start:end] += chirp * (0.5 - bird['pan'] * 0.5)
+            birds_right[start:end] += chirp * (0.5 + bird['pan'] * 0.5)
+
+        # Distant cafe chatter - very low filtered noise bursts
+        chatter = np.where(
+            self._rng.random(num_samples, dtype=np.float32) < 0.3,
+            brown * 0.03,
+            np.float32(0.0)
+        )
+
+        # Trickling stream
+        stream = (
+            _sine_wave(180, sample_rate, num_samples) * 0.02 +
+            _sine_wave(220, sample_rate, num_samples) * 0.015 +
+            stream_fut.result() * 0.02
+        ) * (0.7 + 0.3 * np.sin(t * 0.5))
+
+        # Wind chimes - occasional, gated by the slow sine
+        chime_sum = np.zeros(num_samples, dtype=np.float32)
+        for freq in (523, 659, 784, 880):  # C5, E5, G5, A5
+            chime_sum += _sine_wave(freq, sample_rate, num_samples)
+        decay = np.exp(-(t % 3) * 2)
+        chimes = np.where(
+            np.sin(t * 0.1) > 0.95,
+            chime_sum * decay * 0.02,
+            np.float32(0.0)
+        )
+
+        # Combine
+        sample = breeze + birds + chatter + stream + chimes
+
+        # Stereo with bird panning
+        left = sample * 0.9 + birds_left
+        right = sample * 0.9 + birds_right
+
+        return self._interleave_channels(left, right)
     
     # =========================================================================
     # SPACESHIP - Deep drone, electronic hum, minimal sci-fi atmosphere
     # =========================================================================
     
-    def _generate_spaceship(self, duration: float, sample_rate: int) -> bytes:
+    def _generate_spaceship(self, duration: float, sample_rate: int) -> "np.ndarray":
         """Generate deep focus spaceship ambience."""
         num_samples = int(duration * sample_rate)
-        left_channel = []
-        right_channel = []
-        
+        t = np.arange(num_samples, dtype=np.float32) / sample_rate
+
+        # Pressurization noise integrates on the pool while the drone
+        # stack is summed here
+        pressure_fut = self._brown_noise_future(num_samples)
+
         # Control panel beep timings
         beep_times = []
-        t = random.uniform(8, 15)
-        while t < duration:
+        event_t = random.uniform(8, 15)
+        while event_t < duration:
             beep_times.append({
-                'time': t,
+                'time': event_t,
                 'freq': random.choice([880, 1047, 1175, 1319]),  # A5, C6, D6, E6
                 'duration': random.uniform(0.05, 0.15)
             })
-            t += random.uniform(12, 30)
-        
-        for i in range(num_samples):
-            t = i / sample_rate
-            
-            # Deep engine drone - multiple low frequencies
-            drone = (
-                math.sin(t * 30 * 2 * math.pi) * 0.25 +
-                math.sin(t * 32 * 2 * math.pi) * 0.2 +   # Slight detune
-                math.sin(t * 45 * 2 * math.pi) * 0.15 +
-                math.sin(t * 60 * 2 * math.pi) * 0.1
-            )
-            
-            # Slow drone modulation
-            drone *= 0.8 + 0.2 * math.sin(t * 0.03)
-            
-            # Life support - rhythmic subtle pulse
-            life_support_cycle = 4.0  # 4 second cycle
-            life_support_phase = (t % life_support_cycle) / life_support_cycle
-            life_support = (
-                math.sin(life_support_phase * 2 * math.pi) * 0.5 + 0.5
-            ) * 0.05 * math.sin(t * 80 * 2 * math.pi)
-            
-            # Cabin pressurization - very slow whoosh
-            pressure_cycle = 20.0
-            pressure_phase = (t % pressure_cycle) / pressure_cycle
-            pressure = self._brown_noise() * 0.03 * (
-                0.3 + 0.7 * abs(math.sin(pressure_phase * math.pi))
+            event_t += random.uniform(12, 30)
+
+        # Deep engine drone - multiple low frequencies
+        drone = (
+            _sine_wave(30, sample_rate, num_samples) * 0.25 +
+            _sine_wave(32, sample_rate, num_samples) * 0.2 +   # Slight detune
+            _sine_wave(45, sample_rate, num_samples) * 0.15 +
+            _sine_wave(60, sample_rate, num_samples) * 0.1
+        )
+
+        # Slow drone modulation
+        drone *= 0.8 + 0.2 * np.sin(t * 0.03)
+
+        # Life support - rhythmic subtle pulse
+        life_support_cycle = 4.0  # 4 second cycle
+        life_support_phase = _cycle_phase(t, life_support_cycle)
+        life_support = (
+            np.sin(life_support_phase * _TAU) * 0.5 + 0.5
+        ) * 0.05 * _sine_wave(80, sample_rate, num_samples)
+
+        # Cabin pressurization - very slow whoosh
+        pressure_cycle = 20.0
+        pressure_phase = _cycle_phase(t, pressure_cycle)
+        pressure = pressure_fut.result() * 0.03 * (
+            0.3 + 0.7 * np.abs(np.sin(pressure_phase * math.pi))
+        )
+
+        # High ethereal tones - "star frequencies"
+        stars = (
+            _sine_wave(1200, sample_rate, num_samples) * 0.01 +
+            _sine_wave(1350, sample_rate, num_samples) * 0.008
+        ) * (0.3 + 0.7 * np.sin(t * 0.05))
+
+        # Occasional control panel beeps - each only touches its slice
+        beeps = np.zeros(num_samples, dtype=np.float32)
+        for beep in beep_times:
+            start = int(beep['time'] * sample_rate)
+            end = min(num_samples, start + int(beep['duration'] * sample_rate))
+            if start >= num_samples:
+                continue
+            beep_t = t[start:end] - np.float32(beep['time'])
+            beep_env = 1 - (beep_t / beep['duration'])
+            beeps[start:end] += (
+                np.sin(beep_t * (beep['freq'] * _TAU)) * beep_env * 0.08
             )
-            
-            # High ethereal tones - "star frequencies"
-            stars = (
-                math.sin(t * 1200 * 2 * math.pi) * 0.01 +
-                math.sin(t * 1350 * 2 * math.pi) * 0.008
-            ) * (0.3 + 0.7 * math.sin(t * 0.05))
-            
-            # Occasional control panel beeps
-            beeps = 0.0
-            for beep in beep_times:
-                if beep['time'] <= t < beep['time'] + beep['duration']:
-                    beep_t = t - beep['time']
-                    beep_env = 1 - (beep_t / beep['duration'])
-                    beeps += math.sin(beep_t * beep['freq'] * 2 * math.pi) * beep_env * 0.08
-            
-            # Combine
-            sample = drone + life_support + pressure + stars + beeps
-            
-            # Stereo - subtle movement
-            pan = math.sin(t * 0.02) * 0.1
-            left = sample * (1 - pan)
-            right = sample * (1 + pan)
-            
-            left_channel.append(max(-0.95, min(0.95, left)))
-            right_channel.append(max(-0.95, min(0.95, right)))
-        
-        return self._channels_to_bytes(left_channel, right_channel)
+
+        # Combine
+        sample = drone + life_support + pressure + stars + beeps
+
+        # Stereo - subtle movement
+        pan = np.sin(t * 0.02) * 0.1
+        left = sample * (1 - pan)
+        right = sample * (1 + pan)
+
+        return self._interleave_channels(left, right)
     
     # =========================================================================
     # OCEAN MEDITATION - Waves, seagulls, peaceful beach
     # =========================================================================
     
-    def _generate_ocean(self, duration: float, sample_rate: int) -> bytes:
+    def _generate_ocean(self, duration: float, sample_rate: int) -> "np.ndarray":
         """Generate ocean meditation soundscape."""
         num_samples = int(duration * sample_rate)
-        left_channel = []
-        right_channel = []
-        
+        t = np.arange(num_samples, dtype=np.float32) / sample_rate
+
         # Wave parameters - each wave is unique
         wave_period = 8.0  # Seconds per wave cycle
-        
+
+        # Five full-length noise buffers feed the wave cycle; shape
+        # them on the pool while the envelopes are computed here
+        brown_fut = self._brown_noise_future(num_samples)
+        pink_fut = self._pink_noise_future(num_samples)
+        wind_fut = self._brown_noise_future(num_samples)
+        stereo_fut = self._pink_noise_future(num_samples)
+
         # Seagull timings
         seagull_times = []
-        t = random.uniform(10, 20)
-        while t < duration:
+        event_t = random.uniform(10, 20)
+        while event_t < duration:
             seagull_times.append({
-                'time': t,
+                'time': event_t,
                 'duration': random.uniform(0.5, 1.5),
                 'base_freq': random.uniform(800, 1200)
             })
-            t += random.uniform(20, 45)
-        
-        for i in range(num_samples):
-            t = i / sample_rate
-            
-            # Wave cycle
-            wave_phase = (t % wave_period) / wave_period
-            
-            # Wave building (0 to 0.4)
-            # Wave crashing (0.4 to 0.6)
-            # Wave receding (0.6 to 1.0)
-            
-            if wave_phase < 0.4:
-                # Building wave - rising rumble
-                wave_env = math.sin(wave_phase / 0.4 * math.pi / 2) ** 2
-                wave = (
-                    self._brown_noise() * 0.3 * wave_env +
-                    math.sin(t * 40 * 2 * math.pi) * 0.1 * wave_env
-                )
-            elif wave_phase < 0.6:
-                # Crashing - white noise burst
-                crash_phase = (wave_phase - 0.4) / 0.2
-                crash_env = math.sin(crash_phase * math.pi)
-                wave = (
-                    self._white_noise() * 0.4 * crash_env +
-                    self._pink_noise() * 0.3 * crash_env
-                )
-            else:
-                # Receding - gentle hiss
-                recede_phase = (wave_phase - 0.6) / 0.4
-                recede_env = 1 - recede_phase
-                wave = (
-                    self._pink_noise() * 0.2 * recede_env +
-                    self._brown_noise() * 0.1 * recede_env
-                )
-            
-            # Underwater resonance during wave swell
-            underwater = math.sin(t * 25 * 2 * math.pi) * 0.08 * (
-                0.3 + 0.7 * math.sin(wave_phase * math.pi)
+            event_t += random.uniform(20, 45)
+
+        # Wave cycle
+        wave_phase = _cycle_phase(t, wave_period)
+
+        white = self._white_noise_buffer(num_samples)
+        brown = brown_fut.result()
+        pink = pink_fut.result()
+
+        # Wave building (0 to 0.4): rising rumble
+        build_env = np.sin(wave_phase / 0.4 * (math.pi / 2)) ** 2
+        build = (
+            brown * 0.3 * build_env +
+            _sine_wave(40, sample_rate, num_samples) * 0.1 * build_env
+        )
+        # Wave crashing (0.4 to 0.6): white noise burst
+        crash_env = np.sin((wave_phase - 0.4) / 0.2 * math.pi)
+        crash = (white * 0.4 + pink * 0.3) * crash_env
+        # Wave receding (0.6 to 1.0): gentle hiss
+        recede_env = 1 - (wave_phase - 0.6) / 0.4
+        recede = (pink * 0.2 + brown * 0.1) * recede_env
+
+        wave = np.select(
+            [wave_phase < 0.4, wave_phase < 0.6],
+            [build, crash],
+            default=recede
+        ).astype(np.float32)
+
+        # Underwater resonance during wave swell
+        underwater = _sine_wave(25, sample_rate, num_samples) * 0.08 * (
+            0.3 + 0.7 * np.sin(wave_phase * math.pi)
+        )
+
+        # Gentle wind
+        wind = wind_fut.result() * 0.05 * (
+            0.7 + 0.3 * np.sin(t * 0.1)
+        )
+
+        # Distant seagulls - each cry only touches its slice
+        seagulls = np.zeros(num_samples, dtype=np.float32)
+        for gull in seagull_times:
+            start = int(gull['time'] * sample_rate)
+            end = min(num_samples, start + int(gull['duration'] * sample_rate))
+            if start >= num_samples:
+                continue
+            gull_t = t[start:end] - np.float32(gull['time'])
+            gull_phase = gull_t / gull['duration']
+            # Seagull cry - frequency sweep
+            freq = gull['base_freq'] * (
+                1 + 0.5 * np.sin(gull_phase * (4 * math.pi))
             )
-            
-            # Gentle wind
-            wind = self._brown_noise() * 0.05 * (0.7 + 0.3 * math.sin(t * 0.1))
-            
-            # Distant seagulls
-            seagulls = 0.0
-            for gull in seagull_times:
-                if gull['time'] <= t < gull['time'] + gull['duration']:
-                    gull_t = t - gull['time']
-                    gull_phase = gull_t / gull['duration']
-                    # Seagull cry - frequency sweep
-                    freq = gull['base_freq'] * (1 + 0.5 * math.sin(gull_phase * 4 * math.pi))
-                    env = math.sin(gull_phase * math.pi) * 0.08
-                    seagulls += math.sin(gull_t * freq * 2 * math.pi) * env
-            
-            # Combine
-            sample = wave + underwater + wind + seagulls
-            
-            # Stereo - waves move slightly
-            wave_pan = math.sin(wave_phase * 2 * math.pi) * 0.15
-            left = sample * (1 - wave_pan) + self._pink_noise() * 0.02
-            right = sample * (1 + wave_pan) + self._pink_noise() * 0.02
-            
-            left_channel.append(max(-0.95, min(0.95, left)))
-            right_channel.append(max(-0.95, min(0.95, right)))
-        
-        return self._channels_to_bytes(left_channel, right_channel)
+            env = np.sin(gull_phase * math.pi) * 0.08
+            seagulls[start:end] += np.sin(gull_t * freq * _TAU) * env
+
+        # Combine
+        sample = wave + underwater + wind + seagulls
+
+        # Stereo - waves move slightly
+        wave_pan = np.sin(wave_phase * _TAU) * 0.15
+        stereo = stereo_fut.result() * 0.02
+        left = sample * (1 - wave_pan) + stereo
+        right = sample * (1 + wave_pan) - stereo
+
+        return self._interleave_channels(left, right)
     
     # =========================================================================
     # NIGHT CODING LOFI - Lofi beats, vinyl crackle, city vibes
     # =========================================================================
     
-    def _generate_lofi(self, duration: float, sample_rate: int) -> bytes:
+    def _generate_lofi(self, duration: float, sample_rate: int) -> "np.ndarray":
         """Generate night coding lofi ambience."""
         num_samples = int(duration * sample_rate)
-        left_channel = []
-        right_channel = []
-        
+
         # BPM for the lofi beat
         bpm = 72
         beat_duration = 60.0 / bpm
@@ -474,121 +696,147 @@ class AudioGenProvider(AudioProvider):
             [196.00, 246.94, 293.66, 369.99],  # G7
         ]
         chord_duration = beat_duration * 8  # 2 bars per chord
-        
-        for i in range(num_samples):
-            t = i / sample_rate
-            
-            # Vinyl crackle - constant subtle texture
-            crackle = 0.0
-            if random.random() < 0.02:
-                crackle = random.gauss(0, 0.05)
-            crackle += self._pink_noise() * 0.015
-            
-            # Lofi drum pattern
-            beat_pos = t % (beat_duration * 4)  # 4 beat pattern
-            
-            # Kick on 1 and 3 (with slight swing)
-            kick = 0.0
-            kick_times = [0, beat_duration * 2.05]  # Slight swing on beat 3
-            for kt in kick_times:
-                if kt <= beat_pos < kt + 0.1:
-                    kick_t = beat_pos - kt
-                    kick = math.sin(kick_t * 60 * 2 * math.pi) * math.exp(-kick_t * 30) * 0.3
-            
-            # Snare/rim on 2 and 4
-            snare = 0.0
-            snare_times = [beat_duration * 1, beat_duration * 3]
-            for st in snare_times:
-                if st <= beat_pos < st + 0.08:
-                    snare_t = beat_pos - st
-                    snare = (
-                        self._white_noise() * math.exp(-snare_t * 40) * 0.15 +
-                        math.sin(snare_t * 200 * 2 * math.pi) * math.exp(-snare_t * 50) * 0.1
-                    )
-            
-            # Hi-hat - 8th notes with velocity variation
-            hihat = 0.0
-            hihat_interval = beat_duration / 2
-            hihat_pos = beat_pos % hihat_interval
-            if hihat_pos < 0.03:
-                velocity = 0.5 + 0.5 * (1 if int(beat_pos / hihat_interval) % 2 == 0 else 0.5)
-                hihat = self._white_noise() * math.exp(-hihat_pos * 100) * 0.08 * velocity
-            
-            # Chord pad - warm, filtered
-            chord_idx = int((t / chord_duration) % len(chords))
-            chord = chords[chord_idx]
-            pad = 0.0
+
+        t = np.arange(num_samples, dtype=np.float32) / sample_rate
+
+        # Noise textures shaped on the pool while the drum pattern and
+        # chord pad are computed here
+        crackle_fut = self._pink_noise_future(num_samples)
+        city_fut = self._brown_noise_future(num_samples)
+        rain_fut = self._pink_noise_future(num_samples)
+        stereo_fut = self._pink_noise_future(num_samples)
+
+        # Vinyl crackle - constant subtle texture with sparse pops
+        crackle = np.where(
+            self._rng.random(num_samples, dtype=np.float32) < 0.02,
+            0.05 * self._rng.standard_normal(num_samples, dtype=np.float32),
+            np.float32(0.0)
+        )
+        crackle += crackle_fut.result() * 0.015
+
+        # Lofi drum pattern
+        beat_pos = t % np.float32(beat_duration * 4)  # 4 beat pattern
+
+        # Kick on 1 and 3 (with slight swing)
+        kick = np.zeros(num_samples, dtype=np.float32)
+        kick_times = [0, beat_duration * 2.05]  # Slight swing on beat 3
+        for kt in kick_times:
+            mask = (beat_pos >= kt) & (beat_pos < kt + 0.1)
+            kick_t = beat_pos[mask] - np.float32(kt)
+            kick[mask] = (
+                np.sin(kick_t * (60 * _TAU)) * np.exp(-kick_t * 30) * 0.3
+            )
+
+        # Snare/rim on 2 and 4
+        snare = np.zeros(num_samples, dtype=np.float32)
+        snare_times = [beat_duration * 1, beat_duration * 3]
+        for st in snare_times:
+            mask = (beat_pos >= st) & (beat_pos < st + 0.08)
+            snare_t = beat_pos[mask] - np.float32(st)
+            snare[mask] = (
+                self._white_noise_buffer(int(mask.sum()))
+                * np.exp(-snare_t * 40) * 0.15 +
+                np.sin(snare_t * (200 * _TAU)) * np.exp(-snare_t * 50) * 0.1
+            )
+
+        # Hi-hat - 8th notes with velocity variation
+        hihat_interval = beat_duration / 2
+        hihat_pos = beat_pos % np.float32(hihat_interval)
+        hihat_mask = hihat_pos < 0.03
+        eighth_idx = (beat_pos / hihat_interval).astype(np.int32)
+        velocity = 0.5 + 0.5 * np.where(
+            eighth_idx % 2 == 0, np.float32(1.0), np.float32(0.5)
+        )
+        hihat = np.zeros(num_samples, dtype=np.float32)
+        hihat[hihat_mask] = (
+            self._white_noise_buffer(int(hihat_mask.sum()))
+            * np.exp(-hihat_pos[hihat_mask] * 100) * 0.08
+            * velocity[hihat_mask]
+        )
+
+        # Chord pad - warm, filtered, slightly detuned for warmth
+        chord_idx = ((t / chord_duration) % len(chords)).astype(np.int32)
+        pad = np.zeros(num_samples, dtype=np.float32)
+        for ci, chord in enumerate(chords):
+            mask = chord_idx == ci
+            tc = t[mask]
             for note_freq in chord:
-                # Slightly detune for warmth
-                detune = 1 + random.gauss(0, 0.002)
-                pad += math.sin(t * note_freq * detune * 2 * math.pi) * 0.03
-            # Low-pass filter effect (simple)
-            pad *= 0.6 + 0.4 * math.sin(t * 0.2)
-            
-            # Bass - root note, simple pattern
-            bass_freq = chord[0] / 2  # One octave down
-            bass_pattern_pos = beat_pos % (beat_duration * 2)
-            bass = 0.0
-            if bass_pattern_pos < beat_duration * 0.8:
-                bass = math.sin(t * bass_freq * 2 * math.pi) * 0.2
-                # Envelope
-                bass *= 0.8 + 0.2 * math.cos(bass_pattern_pos / (beat_duration * 0.8) * math.pi)
-            
-            # Distant city - very subtle
-            city = self._brown_noise() * 0.02
-            
-            # Rain on window - subtle
-            rain = self._pink_noise() * 0.03 * (0.7 + 0.3 * math.sin(t * 0.05))
-            
-            # Combine
-            sample = crackle + kick + snare + hihat + pad + bass + city + rain
-            
-            # Stereo width
-            left = sample + pad * 0.1 + self._pink_noise() * 0.01
-            right = sample - pad * 0.1 + self._pink_noise() * 0.01
-            
-            left_channel.append(max(-0.95, min(0.95, left)))
-            right_channel.append(max(-0.95, min(0.95, right)))
-        
-        return self._channels_to_bytes(left_channel, right_channel)
+                detune = 1 + 0.002 * self._rng.standard_normal(
+                    tc.size, dtype=np.float32
+                )
+                pad[mask] += np.sin(tc * (note_freq * detune) * _TAU) * 0.03
+        # Low-pass filter effect (simple)
+        pad *= 0.6 + 0.4 * np.sin(t * 0.2)
+
+        # Bass - root note, simple pattern, one octave down
+        bass_freq = np.array(
+            [chord[0] / 2 for chord in chords], dtype=np.float32
+        )[chord_idx]
+        bass_pattern_pos = beat_pos % np.float32(beat_duration * 2)
+        bass_env = 0.8 + 0.2 * np.cos(
+            bass_pattern_pos / (beat_duration * 0.8) * math.pi
+        )
+        bass = np.where(
+            bass_pattern_pos < beat_duration * 0.8,
+            np.sin(t * bass_freq * _TAU) * 0.2 * bass_env,
+            np.float32(0.0)
+        )
+
+        # Distant city - very subtle
+        city = city_fut.result() * 0.02
+
+        # Rain on window - subtle
+        rain = rain_fut.result() * 0.03 * (
+            0.7 + 0.3 * np.sin(t * 0.05)
+        )
+
+        # Combine
+        sample = crackle + kick + snare + hihat + pad + bass + city + rain
+
+        # Stereo width
+        stereo = stereo_fut.result() * 0.01
+        left = sample + pad * 0.1 + stereo
+        right = sample - pad * 0.1 - stereo
+
+        return self._interleave_channels(left, right)
     
     # =========================================================================
     # GENERIC AMBIENT - Fallback for custom prompts
     # =========================================================================
     
-    def _generate_generic_ambient(self, duration: float, sample_rate: int) -> bytes:
+    def _generate_generic_ambient(self, duration: float, sample_rate: int) -> "np.ndarray":
         """Generate generic ambient soundscape."""
         num_samples = int(duration * sample_rate)
-        left_channel = []
-        right_channel = []
-        
-        for i in range(num_samples):
-            t = i / sample_rate
-            
-            # Warm pad drone
-            pad = (
-                math.sin(t * 110 * 2 * math.pi) * 0.15 +
-                math.sin(t * 165 * 2 * math.pi) * 0.1 +
-                math.sin(t * 220 * 2 * math.pi) * 0.08
-            ) * (0.7 + 0.3 * math.sin(t * 0.05))
-            
-            # Subtle texture
-            texture = self._brown_noise() * 0.05
-            
-            # Occasional tones
-            tones = 0.0
-            if math.sin(t * 0.1) > 0.9:
-                tones = math.sin(t * 440 * 2 * math.pi) * 0.02
-            
-            sample = pad + texture + tones
-            
-            left = sample + self._brown_noise() * 0.02
-            right = sample + self._brown_noise() * 0.02
-            
-            left_channel.append(max(-0.95, min(0.95, left)))
-            right_channel.append(max(-0.95, min(0.95, right)))
-        
-        return self._channels_to_bytes(left_channel, right_channel)
+        t = np.arange(num_samples, dtype=np.float32) / sample_rate
+
+        # Texture noise integrates on the pool alongside the pad
+        texture_fut = self._brown_noise_future(num_samples)
+        stereo_fut = self._brown_noise_future(num_samples)
+
+        # Warm pad drone
+        pad = (
+            _sine_wave(110, sample_rate, num_samples) * 0.15 +
+            _sine_wave(165, sample_rate, num_samples) * 0.1 +
+            _sine_wave(220, sample_rate, num_samples) * 0.08
+        ) * (0.7 + 0.3 * np.sin(t * 0.05))
+
+        # Subtle texture
+        texture = texture_fut.result() * 0.05
+
+        # Occasional tones, gated by the slow sine
+        tones = np.where(
+            np.sin(t * 0.1) > 0.9,
+            _sine_wave(440, sample_rate, num_samples) * 0.02,
+            np.float32(0.0)
+        )
+
+        sample = pad + texture + tones
+
+        stereo = stereo_fut.result() * 0.02
+        left = sample + stereo
+        right = sample - stereo
+
+        return self._interleave_channels(left, right)
     
     # =========================================================================
     # NOISE GENERATORS
@@ -615,6 +863,91 @@ class AudioGenProvider(AudioProvider):
         
         return sum(self._pink_noise_state) / 7
     
+    def _white_noise_buffer(self, n: int) -> "np.ndarray":
+        """Generate a whole buffer of white noise in one call."""
+        return self._rng.random(n, dtype=np.float32) * 2 - 1
+
+    def _pink_noise_buffer(self, n: int) -> "np.ndarray":
+        """
+        Generate a whole buffer of pink noise via FFT filtering.
+
+        Shapes white noise by 1/sqrt(f) in the frequency domain - one
+        rfft/irfft pair for the entire buffer, an exact 1/f spectrum
+        rather than the stepped Voss-McCartney approximation. Twice
+        the samples are generated and the first half kept, so the
+        output is not circularly periodic.
+        """
+        return self._shape_pink_noise(
+            self._rng.standard_normal(2 * n, dtype=np.float32), n
+        )
+
+    def _pink_noise_future(self, n: int) -> "Future":
+        """Draw the white base now, shape it on the noise pool.
+
+        The draw happens on the calling thread, so the np.random call
+        order - and therefore seeded output - does not depend on
+        worker scheduling.
+        """
+        white = self._rng.standard_normal(2 * n, dtype=np.float32)
+        return _NOISE_POOL.submit(self._shape_pink_noise, white, n)
+
+    def _shape_pink_noise(self, white: "np.ndarray", n: int) -> "np.ndarray":
+        """Filter a pre-drawn white base into n samples of pink noise."""
+        if n <= 1:
+            return np.zeros(n, dtype=np.float32)
+
+        spectrum = np.fft.rfft(white)
+        freqs = np.fft.rfftfreq(2 * n)
+        spectrum[1:] /= np.sqrt(freqs[1:])
+        spectrum[0] = 0
+        pink = np.fft.irfft(spectrum, 2 * n)[:n].astype(np.float32)
+
+        # Match the amplitude of the scalar generator (7 averaged
+        # uniform rows, std ~= 0.22) the mood mix levels assume
+        std = float(pink.std())
+        if std > 0:
+            pink *= 0.22 / std
+        return pink
+
+    def _white_base(self, n: int) -> "np.ndarray":
+        """Float32 white base in [-0.1, 0.1) for the brown-noise filter."""
+        return (self._rng.random(n, dtype=np.float32) - 0.5) * 0.2
+
+    def _brown_noise_buffer(self, n: int) -> "np.ndarray":
+        """
+        Generate a whole buffer of brown noise in one vectorized pass.
+
+        Solves the scalar generator's leaky-integrator recurrence
+        y[i] = 0.99 * (y[i-1] + 0.1 * white[i]) in closed form:
+        dividing out the exponential decay turns it into a cumulative
+        sum. Processed in blocks so the decay scaling factors stay
+        well within float64 range, unlike the plain random walk this
+        replaces the filter is stationary and needs no global rescale.
+        """
+        return self._integrate_brown_noise(self._white_base(n))
+
+    def _brown_noise_future(self, n: int) -> "Future":
+        """Draw the white base now, integrate it on the noise pool."""
+        white = self._white_base(n)
+        return _NOISE_POOL.submit(self._integrate_brown_noise, white)
+
+    def _integrate_brown_noise(self, white: "np.ndarray") -> "np.ndarray":
+        """Run the leaky-integrator filter over a pre-drawn white base."""
+        n = white.size
+        leak = 0.99
+        block = 4096
+        decay = leak ** np.arange(1, block + 1)
+        grow = leak ** -np.arange(block)
+        out = np.empty(n, dtype=np.float32)
+        state = 0.0
+        for start in range(0, n, block):
+            x = white[start:start + block]
+            m = x.size
+            y = decay[:m] * (state + np.cumsum(x * grow[:m]))
+            out[start:start + m] = y
+            state = y[-1]
+        return np.clip(out, -1.0, 1.0, out=out)
+
     def _brown_noise(self) -> float:
         """Generate brown (red) noise."""
         white = self._white_noise() * 0.1
@@ -626,29 +959,52 @@ class AudioGenProvider(AudioProvider):
     # UTILITIES
     # =========================================================================
     
-    def _channels_to_bytes(self, left: list, right: list) -> bytes:
-        """Convert stereo channels to interleaved 16-bit PCM bytes."""
-        audio_bytes = bytearray()
-        for l, r in zip(left, right):
-            l_int = int(l * 32767)
-            r_int = int(r * 32767)
-            audio_bytes.extend(struct.pack('<h', l_int))
-            audio_bytes.extend(struct.pack('<h', r_int))
-        return bytes(audio_bytes)
+    def _interleave_channels(
+        self,
+        left: "np.ndarray",
+        right: "np.ndarray"
+    ) -> "np.ndarray":
+        """Quantize stereo channels into an interleaved int16 array.
+
+        One C-level quantize + interleave per channel, written into
+        the thread's reusable scratch buffer. The returned view is
+        valid until the same thread's next render; callers serialize
+        or copy it before then. Scaling and clipping mutate the input
+        channels in place - they are always render-local scratch.
+
+        The generators' 0.95 headroom ceiling is applied here, fused
+        with the scale: clipping the already-scaled samples costs no
+        extra memory pass, where a separate float clip per channel in
+        each generator did.
+        """
+        limit = np.float32(0.95 * 32767.0)
+        interleaved = _interleave_scratch(len(left))
+        for column, channel in ((0, left), (1, right)):
+            channel = np.asarray(channel, dtype=np.float32)
+            np.multiply(channel, np.float32(32767.0), out=channel)
+            np.clip(channel, -limit, limit, out=channel)
+            interleaved[:, column] = channel
+        return interleaved
     
     def _write_wav(
         self,
         filepath: str,
-        audio_data: bytes,
+        audio_data: "np.ndarray",
         sample_rate: int = 44100,
         channels: int = 2,
         bits_per_sample: int = 16
     ) -> None:
-        """Write audio data to a WAV file."""
+        """Write interleaved int16 frames to a WAV file.
+
+        Streams one-second blocks so peak memory stays O(block) on top
+        of the sample array instead of duplicating the whole PCM.
+        """
         import wave
-        
+
         with wave.open(filepath, 'wb') as wav_file:
             wav_file.setnchannels(channels)
             wav_file.setsampwidth(bits_per_sample // 8)
             wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_data)
+            for start in range(0, len(audio_data), sample_rate):
+                block = audio_data[start:start + sample_rate]
+                wav_file.writeframes(block.tobytes())
@@ -5,36 +5,121 @@ Bark is an open-source text-to-audio model that can generate
 music, sound effects, and ambient sounds.
 """
 
+import functools
 import os
-import struct
 import math
 import random
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+
 from .base import AudioProvider, GenerationResult, ProviderError
 
 
+_TAU = 2 * math.pi
+
+# Worker pool for noise shaping; the FFT and blockwise filter passes
+# spend their time in NumPy C code that releases the GIL, so shaping
+# overlaps the tonal work on the calling thread
+_NOISE_POOL = ThreadPoolExecutor(max_workers=3)
+
+# Space-drone oscillator bank: six harmonics of 40 Hz with a 1/h**1.3
+# rolloff and a slow per-harmonic detune, hoisted out of the generator
+_SPACE_HARMONICS = np.arange(1, 7, dtype=np.float32)
+_SPACE_FREQS = _SPACE_HARMONICS * np.float32(40.0)
+_SPACE_GAINS = 1.0 / _SPACE_HARMONICS ** np.float32(1.3)
+_SPACE_DETUNE_RATES = _SPACE_HARMONICS * np.float32(0.08)
+
+
+@functools.lru_cache(maxsize=32)
+def _sine_second(freq: int, sample_rate: int) -> "np.ndarray":
+    """One cached second of a sine at an integer frequency.
+
+    Whole cycles per second means the block tiles without a seam, so
+    the fixed-frequency hums and pads come from a small table instead
+    of a fresh full-length sin evaluation every render.
+    """
+    i = np.arange(sample_rate, dtype=np.float32)
+    return np.sin(i * np.float32(_TAU * freq / sample_rate))
+
+
+def _sine_wave(freq: int, sample_rate: int, n: int) -> "np.ndarray":
+    """n samples of a fixed-frequency sine, tiled from the cached second."""
+    return np.resize(_sine_second(freq, sample_rate), n)
+
+
+def _one_pole(signal: "np.ndarray", leak: float, gain: float) -> "np.ndarray":
+    """Closed-form blockwise solve of y[i] = leak * y[i-1] + gain * x[i].
+
+    Dividing the exponential decay out of the recurrence turns each
+    block into a cumulative sum, so the serial one-pole filters behind
+    the pink/brown/filtered noise run as vectorized passes instead of
+    per-sample Python. Blocks are sized so the decay scaling factors
+    stay inside float64 range even for fast-leaking taps.
+    """
+    n = signal.size
+    block = min(4096, max(8, int(600.0 / -math.log(abs(leak)))))
+    decay = np.power(leak, np.arange(block))
+    grow = np.power(leak, -np.arange(block))
+    out = np.empty(n, dtype=np.float32)
+    state = 0.0
+    for start in range(0, n, block):
+        x = signal[start:start + block]
+        m = x.size
+        y = decay[:m] * (leak * state + np.cumsum(x * (gain * grow[:m])))
+        out[start:start + m] = y
+        state = y[-1]
+    return out
+
+
 class BarkProvider(AudioProvider):
     """
     Audio generation provider using Bark-style synthesis.
-    
+
     Produces distinct ambient soundscapes with unique
     characteristics for each mood preset.
     """
-    
+
     name = "bark"
     description = "Bark open-source audio generation"
-    
+
     def __init__(self, debug: bool = False):
         super().__init__(debug)
         self._bark_available = None
         self._sample_rate = 24000  # Bark uses 24kHz
-        
-        # State for continuous sounds
-        self._noise_state = [0.0] * 16
-        self._oscillator_phases = [0.0] * 16
-    
+        # PCG64 generator for all noise draws; batched float32 output
+        # instead of legacy per-call global-state uniforms
+        self._rng = np.random.default_rng()
+
+        # Filter state for the scalar streaming fallbacks, as named
+        # floats instead of a magic-indexed list of boxed entries
+        self._pink0 = self._pink1 = self._pink2 = 0.0
+        self._pink3 = self._pink4 = self._pink5 = 0.0
+        self._brown_state = 0.0
+        self._lp_state = 0.0
+        self._hp_state = 0.0
+
+        # Scratch reused across renders: the time vector depends only
+        # on clip length, and the int16 conversion buffer is grown to
+        # the largest request and sliced, so steady-state renders of a
+        # fixed duration allocate neither
+        self._time_scratch = np.empty(0, dtype=np.float32)
+        self._pcm_scratch = np.empty(0, dtype="<i2")
+
+        # Sparse-event timing in samples, derived once from the fixed
+        # sample rate instead of recomputed inside every render
+        sr = self._sample_rate
+        self._drip_period = int(sr * 1.8)
+        self._drip_win = 150
+        self._thunder_period = sr * 40
+        self._thunder_win = sr * 3
+        self._beep_period = sr * 15
+        self._beep_win = int(sr * 0.08)
+        self._gull_period = sr * 30
+        self._gull_win = int(sr * 0.6)
+
     def is_available(self) -> bool:
         """Check if Bark is installed and available."""
         if self._bark_available is None:
@@ -45,7 +130,7 @@ class BarkProvider(AudioProvider):
             except ImportError:
                 self._bark_available = False
         return self._bark_available
-    
+
     def get_config_help(self) -> str:
         return (
             "Bark Configuration:\n"
@@ -59,7 +144,7 @@ class BarkProvider(AudioProvider):
             "    BARK_CACHE_DIR: Model cache directory\n"
             "    CUDA_VISIBLE_DEVICES: GPU selection"
         )
-    
+
     def generate_audio(
         self,
         prompt: str,
@@ -70,24 +155,24 @@ class BarkProvider(AudioProvider):
         """Generate audio using Bark-style synthesis."""
         self.log(f"Generating {duration_seconds}s of audio with Bark...")
         self.log(f"Prompt: {prompt[:100]}...")
-        
+
         try:
             # Detect mood from prompt
             mood = self._detect_mood(prompt)
             self.log(f"Detected mood: {mood}")
-            
+
             # Generate mood-specific audio
             audio_data = self._generate_mood_audio(mood, duration_seconds)
-            
+
             # Ensure output directory exists
             Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            
+
             # Write to WAV file
-            wav_path = output_path.replace('.mp3', '.wav')
+            wav_path = str(Path(output_path).with_suffix('.wav'))
             self._write_wav(wav_path, audio_data, sample_rate=self._sample_rate, channels=1)
-            
+
             self.log(f"Audio saved to: {wav_path}")
-            
+
             return GenerationResult(
                 audio_path=wav_path,
                 duration_seconds=duration_seconds,
@@ -101,14 +186,40 @@ class BarkProvider(AudioProvider):
                     "mood": mood
                 }
             )
-            
+
         except Exception as e:
             raise ProviderError(f"Bark generation failed: {e}")
-    
+
+    def generate_pcm(
+        self,
+        prompt: str,
+        duration_seconds: float,
+        **kwargs
+    ) -> tuple:
+        """
+        Synthesize the soundscape and return the int16 frames directly.
+
+        Serves the in-memory post-processing path: the render pipeline
+        pipes the samples straight into the encoder instead of writing
+        a scratch WAV it decodes again moments later.
+        """
+        self.log(f"Generating {duration_seconds}s of PCM...")
+
+        try:
+            mood = self._detect_mood(prompt)
+            self.log(f"Detected mood: {mood}")
+
+            audio_data = self._generate_mood_audio(mood, duration_seconds)
+            frames = np.frombuffer(audio_data, dtype="<i2").reshape(-1, 1)
+            return frames, self._sample_rate
+
+        except Exception as e:
+            raise ProviderError(f"Bark generation failed: {e}")
+
     def _detect_mood(self, prompt: str) -> str:
         """Detect mood type from prompt."""
         prompt_lower = prompt.lower()
-        
+
         if "rain" in prompt_lower and "office" in prompt_lower:
             return "calm_rain_office"
         elif "forest" in prompt_lower or "cafe" in prompt_lower:
@@ -125,242 +236,466 @@ class BarkProvider(AudioProvider):
             return "ocean_meditation"
         else:
             return "forest_cafe"
-    
+
     def _generate_mood_audio(self, mood: str, duration: float) -> bytes:
-        """Generate mono audio specific to the mood."""
+        """Generate mono audio specific to the mood.
+
+        Each generator receives the shared time and sample-index
+        vectors and returns a float32 buffer; the per-sample Python
+        loop (and its per-sample struct.pack) is gone.
+        """
         num_samples = int(duration * self._sample_rate)
-        
-        generators = {
-            "calm_rain_office": self._generate_rain,
-            "forest_cafe": self._generate_forest,
-            "deep_focus_spaceship": self._generate_space,
-            "ocean_meditation": self._generate_ocean,
-            "night_coding_lofi": self._generate_lofi,
-        }
-        
-        generator = generators.get(mood, self._generate_forest)
-        samples = []
-        
-        for i in range(num_samples):
-            t = i / self._sample_rate
-            sample = generator(t, i)
-            samples.append(max(-1, min(1, sample)))
-        
-        # Convert to 16-bit PCM
-        audio_bytes = bytearray()
-        for s in samples:
-            s_int = int(s * 32767)
-            audio_bytes.extend(struct.pack('<h', s_int))
-        
-        return bytes(audio_bytes)
-    
+        if self._time_scratch.size < num_samples:
+            self._time_scratch = (
+                np.arange(num_samples, dtype=np.float32) / self._sample_rate
+            )
+        t = self._time_scratch[:num_samples]
+
+        generator = self._GENERATORS.get(mood, BarkProvider._generate_forest)
+        samples = generator(self, t)
+
+        # Convert to 16-bit PCM: clip and scale in place, then cast
+        # into the persistent int16 scratch
+        np.clip(samples, -1.0, 1.0, out=samples)
+        samples *= np.float32(32767.0)
+        if self._pcm_scratch.size < num_samples:
+            self._pcm_scratch = np.empty(num_samples, dtype="<i2")
+        pcm = self._pcm_scratch[:num_samples]
+        pcm[:] = samples
+        return pcm.tobytes()
+
     # =========================================================================
     # MOOD GENERATORS
     # =========================================================================
-    
-    def _generate_rain(self, t: float, i: int) -> float:
+
+    def _generate_rain(self, t: "np.ndarray") -> "np.ndarray":
         """Calm rain with indoor ambience."""
-        # Rain noise
-        rain = self._pink_noise() * 0.3
-        rain *= 0.7 + 0.3 * math.sin(t * 0.12)
-        
-        # Drips
-        drip = 0
-        if i % int(self._sample_rate * 1.8) < 150:
-            drip_t = (i % int(self._sample_rate * 1.8)) / self._sample_rate
-            drip = math.sin(drip_t * 600) * math.exp(-drip_t * 25) * 0.12
-        
+        num_samples = t.size
+        sr = self._sample_rate
+
+        # Start the rain bed shaping; it overlaps the event work below
+        rain_fut = self._pink_noise_future(num_samples)
+
+        # Drips - the same short envelope pasted at each event start,
+        # so only events * window samples see any math
+        drip = np.zeros(num_samples, dtype=np.float32)
+        drip_t = np.arange(self._drip_win, dtype=np.float32) / sr
+        drip_env = np.sin(drip_t * 600) * np.exp(-drip_t * 25) * np.float32(0.12)
+        for start in range(0, num_samples, self._drip_period):
+            m = min(self._drip_win, num_samples - start)
+            drip[start:start + m] = drip_env[:m]
+
         # Low hum
-        hum = math.sin(t * 50 * 2 * math.pi) * 0.025
-        
-        # Thunder
-        thunder = 0
-        if i % int(self._sample_rate * 40) < self._sample_rate * 3:
-            thunder_t = (i % int(self._sample_rate * 40)) / self._sample_rate
-            thunder = self._brown_noise() * math.sin(thunder_t * 0.5) ** 2 * 0.15
-        
-        return (rain + drip + hum + thunder) * 0.8
-    
-    def _generate_forest(self, t: float, i: int) -> float:
+        hum = _sine_wave(50, sr, num_samples) * np.float32(0.025)
+
+        # Thunder - one 3s rumble per 40s cycle; brown noise is drawn
+        # only for the rumble windows, not the whole clip
+        thunder = np.zeros(num_samples, dtype=np.float32)
+        thunder_t = np.arange(self._thunder_win, dtype=np.float32) / sr
+        thunder_env = np.sin(thunder_t * 0.5) ** 2 * np.float32(0.15)
+        for start in range(0, num_samples, self._thunder_period):
+            m = min(self._thunder_win, num_samples - start)
+            thunder[start:start + m] = (
+                self._brown_noise_buffer(m) * thunder_env[:m]
+            )
+
+        # Rain noise
+        rain = rain_fut.result()
+        rain *= np.float32(0.3)
+        rain *= 0.7 + 0.3 * np.sin(t * 0.12)
+
+        # Accumulate into the rain buffer - no mix temporaries
+        rain += drip
+        rain += hum
+        rain += thunder
+        rain *= np.float32(0.8)
+        return rain
+
+    def _generate_forest(self, t: "np.ndarray") -> "np.ndarray":
         """Forest with birds and nature sounds."""
-        # Wind in trees
-        wind = self._pink_noise() * (0.4 + 0.2 * math.sin(t * 0.06)) * 0.15
-        
+        num_samples = t.size
+
+        # Queue the three noise beds before the bird work
+        wind_fut = self._pink_noise_future(num_samples)
+        stream_fut = self._filtered_noise_future(num_samples, 500, 2500)
+        cafe_fut = self._filtered_noise_future(num_samples, 150, 500)
+
         # Birds
-        birds = 0
-        
+        birds = np.zeros(num_samples, dtype=np.float32)
+
         # Chirping bird
-        if (t % 4.2) < 0.2:
-            chirp_t = (t % 4.2) / 0.2
-            freq = 2600 + 500 * math.sin(chirp_t * 12)
-            birds += math.sin(t * freq * 2 * math.pi) * math.sin(chirp_t * math.pi) ** 2 * 0.1
-        
+        chirp_pos = t % np.float32(4.2)
+        mask = chirp_pos < 0.2
+        chirp_t = chirp_pos[mask] / np.float32(0.2)
+        freq = 2600 + 500 * np.sin(chirp_t * 12)
+        birds[mask] += (
+            np.sin(t[mask] * freq * np.float32(_TAU))
+            * np.sin(chirp_t * math.pi) ** 2 * 0.1
+        )
+
         # Melodic bird
-        if ((t + 1.5) % 6.8) < 0.35:
-            call_t = ((t + 1.5) % 6.8) / 0.35
-            freq = 1600 + 300 * math.sin(call_t * 10)
-            birds += math.sin(t * freq * 2 * math.pi) * math.sin(call_t * math.pi) * 0.07
-        
+        call_pos = (t + np.float32(1.5)) % np.float32(6.8)
+        mask = call_pos < 0.35
+        call_t = call_pos[mask] / np.float32(0.35)
+        freq = 1600 + 300 * np.sin(call_t * 10)
+        birds[mask] += (
+            np.sin(t[mask] * freq * np.float32(_TAU))
+            * np.sin(call_t * math.pi) * 0.07
+        )
+
+        # Wind in trees
+        wind = wind_fut.result()
+        wind *= (0.4 + 0.2 * np.sin(t * 0.06)) * 0.15
+
         # Stream
-        stream = self._filtered_noise(500, 2500) * 0.06
-        
+        stream = stream_fut.result()
+        stream *= np.float32(0.06)
+
         # Cafe murmur
-        cafe = self._filtered_noise(150, 500) * 0.06
-        
-        return (wind + birds + stream + cafe) * 0.85
-    
-    def _generate_space(self, t: float, i: int) -> float:
+        cafe = cafe_fut.result()
+        cafe *= np.float32(0.06)
+
+        wind += birds
+        wind += stream
+        wind += cafe
+        wind *= np.float32(0.85)
+        return wind
+
+    def _generate_space(self, t: "np.ndarray") -> "np.ndarray":
         """Spaceship engine and electronics."""
-        # Deep drone
-        drone = 0
-        for h in range(1, 7):
-            freq = 40 * h * (1 + 0.002 * math.sin(t * 0.08 * h))
-            drone += math.sin(t * freq * 2 * math.pi) / (h ** 1.3)
-        drone *= 0.2 * (0.85 + 0.15 * math.sin(t * 0.06))
-        
+        num_samples = t.size
+        sr = self._sample_rate
+
+        # Queue the hiss bed so it shapes while the drone sums
+        hiss_fut = self._filtered_noise_future(num_samples, 5000, 10000)
+
+        # Deep drone - six slowly detuning harmonics, mixed down with
+        # one matrix-vector product against the precomputed gains
+        detune = 1 + np.float32(0.002) * np.sin(t[:, None] * _SPACE_DETUNE_RATES)
+        phase = t[:, None] * (_SPACE_FREQS * np.float32(_TAU))
+        phase *= detune
+        drone = np.sin(phase, out=phase) @ _SPACE_GAINS
+        drone *= 0.2 * (0.85 + 0.15 * np.sin(t * 0.06))
+
         # Life support hiss
-        hiss = self._filtered_noise(5000, 10000) * 0.025
-        
+        hiss = hiss_fut.result()
+        hiss *= np.float32(0.025)
+
         # Resonance
-        res = math.sin(t * 68 * 2 * math.pi) * 0.03
-        res += math.sin(t * 136 * 2 * math.pi) * 0.015
-        
-        # Beeps
-        beep = 0
-        if i % int(self._sample_rate * 15) < int(self._sample_rate * 0.08):
-            beep_t = (i % int(self._sample_rate * 15)) / self._sample_rate
-            beep = math.sin(t * 800 * 2 * math.pi) * math.exp(-beep_t * 35) * 0.06
-        
+        res = _sine_wave(68, sr, num_samples) * np.float32(0.03)
+        res += _sine_wave(136, sr, num_samples) * np.float32(0.015)
+
+        # Beeps - 0.08s blip per 15s cycle; the period spans a whole
+        # number of 800 Hz cycles, so one envelope serves every event
+        beep = np.zeros(num_samples, dtype=np.float32)
+        beep_t = np.arange(self._beep_win, dtype=np.float32) / sr
+        beep_env = (
+            np.sin(beep_t * np.float32(800 * _TAU))
+            * np.exp(-beep_t * 35) * np.float32(0.06)
+        )
+        for start in range(0, num_samples, self._beep_period):
+            m = min(self._beep_win, num_samples - start)
+            beep[start:start + m] = beep_env[:m]
+
         # Sub bass
-        sub = math.sin(t * 28 * 2 * math.pi) * 0.08
-        
-        return (drone + hiss + res + beep + sub) * 0.9
-    
-    def _generate_ocean(self, t: float, i: int) -> float:
+        sub = _sine_wave(28, sr, num_samples) * np.float32(0.08)
+
+        drone += hiss
+        drone += res
+        drone += beep
+        drone += sub
+        drone *= np.float32(0.9)
+        return drone
+
+    def _generate_ocean(self, t: "np.ndarray") -> "np.ndarray":
         """Ocean waves and beach."""
-        # Main wave
-        wave_period = 9.0
-        wave_phase = (t % wave_period) / wave_period
-        
-        if wave_phase < 0.45:
-            wave_env = (wave_phase / 0.45) ** 1.3
-        elif wave_phase < 0.55:
-            wave_env = 1.0
-        else:
-            wave_env = 1.0 - ((wave_phase - 0.55) / 0.45) ** 0.6
-        
-        wave = self._brown_noise() * wave_env * 0.35
-        
-        # Foam
-        foam = 0
-        if wave_phase > 0.5:
-            foam_env = math.sin((wave_phase - 0.5) / 0.5 * math.pi)
-            foam = self._filtered_noise(2500, 7000) * foam_env * 0.12
-        
-        # Secondary wave
-        wave2_phase = ((t + 3) % 6.0) / 6.0
-        wave2 = self._brown_noise() * math.sin(wave2_phase * math.pi) ** 2 * 0.12
-        
+        num_samples = t.size
+        sr = self._sample_rate
+
+        # Queue the noise beds; envelope and event work overlap them
+        brown_fut = self._brown_noise_future(num_samples)
+        foam_fut = self._filtered_noise_future(num_samples, 2500, 7000)
+        wind_fut = self._filtered_noise_future(num_samples, 200, 1000)
+
+        # Main wave envelope - piecewise rise / crest / fall, evaluated
+        # per segment so the fractional powers never see negative input
+        wave_phase = (t % np.float32(9.0)) / np.float32(9.0)
+        wave_env = np.ones(num_samples, dtype=np.float32)
+        rising = wave_phase < 0.45
+        falling = wave_phase >= 0.55
+        wave_env[rising] = (wave_phase[rising] / np.float32(0.45)) ** 1.3
+        wave_env[falling] = (
+            1.0 - ((wave_phase[falling] - np.float32(0.55))
+                   / np.float32(0.45)) ** 0.6
+        )
+
+        brown = brown_fut.result()
+        wave = brown * wave_env * 0.35
+
+        # Foam on the second half of the wave
+        foam = np.where(
+            wave_phase > 0.5,
+            foam_fut.result()
+            * np.sin((wave_phase - np.float32(0.5)) * np.float32(math.pi / 0.5))
+            * 0.12,
+            np.float32(0.0)
+        )
+
+        # Secondary wave rides the same excitation
+        wave2_phase = ((t + np.float32(3.0)) % np.float32(6.0)) / np.float32(6.0)
+        wave2 = brown * np.sin(wave2_phase * math.pi) ** 2 * 0.12
+
         # Underwater
-        underwater = math.sin(t * 32 * 2 * math.pi) * wave_env * 0.06
-        
-        # Seagull
-        seagull = 0
-        if i % int(self._sample_rate * 30) < int(self._sample_rate * 0.6):
-            gull_t = (i % int(self._sample_rate * 30)) / self._sample_rate
-            freq = 1600 + 350 * math.sin(gull_t * 5)
-            seagull = math.sin(t * freq * 2 * math.pi) * math.sin(gull_t / 0.6 * math.pi) ** 0.6 * 0.04
-        
+        underwater = _sine_wave(32, sr, num_samples) * wave_env * np.float32(0.06)
+
+        # Seagull - one 0.6s cry per 30s cycle; the cry's frequency
+        # glide and amplitude envelope are shared across events, only
+        # the carrier phase depends on absolute time
+        seagull = np.zeros(num_samples, dtype=np.float32)
+        gull_t = np.arange(self._gull_win, dtype=np.float32) / sr
+        gull_freq = 1600 + 350 * np.sin(gull_t * 5)
+        gull_env = (
+            np.sin(gull_t / np.float32(0.6) * math.pi) ** 0.6
+            * np.float32(0.04)
+        )
+        for start in range(0, num_samples, self._gull_period):
+            m = min(self._gull_win, num_samples - start)
+            seagull[start:start + m] = (
+                np.sin(t[start:start + m] * gull_freq[:m] * np.float32(_TAU))
+                * gull_env[:m]
+            )
+
         # Wind
-        wind = self._filtered_noise(200, 1000) * 0.05
-        
-        return (wave + foam + wave2 + underwater + seagull + wind) * 0.8
-    
-    def _generate_lofi(self, t: float, i: int) -> float:
+        wind = wind_fut.result()
+        wind *= np.float32(0.05)
+
+        wave += foam
+        wave += wave2
+        wave += underwater
+        wave += seagull
+        wave += wind
+        wave *= np.float32(0.8)
+        return wave
+
+    def _generate_lofi(self, t: "np.ndarray") -> "np.ndarray":
         """Lo-fi hip hop beats."""
+        num_samples = t.size
+
+        # Queue the noise beds before the beat-grid work; the snare
+        # white stays a plain draw since it is consumed unshaped
+        snare_white = self._white_noise_buffer(num_samples)
+        hihat_fut = self._filtered_noise_future(num_samples, 7000, 14000)
+        vinyl_fut = self._filtered_noise_future(num_samples, 1500, 5000)
+        rain_fut = self._pink_noise_future(num_samples)
+
         bpm = 72
         beat = 60.0 / bpm
         bar = beat * 4
-        bar_phase = (t % bar) / bar
-        beat_phase = (t % beat) / beat
-        
+        bar_phase = (t % np.float32(bar)) / np.float32(bar)
+
         # Kick
-        kick = 0
-        for kt in [0, 0.5]:
-            kp = (bar_phase - kt) % 1.0
-            if kp < 0.04:
-                kick += math.sin((kp / 0.04) * 55 * math.pi) * math.exp(-kp * 200) * 0.35
-        
+        kick = np.zeros(num_samples, dtype=np.float32)
+        for kt in (0.0, 0.5):
+            kp = (bar_phase - np.float32(kt)) % np.float32(1.0)
+            mask = kp < 0.04
+            kpm = kp[mask]
+            kick[mask] += (
+                np.sin((kpm / np.float32(0.04)) * np.float32(55 * math.pi))
+                * np.exp(-kpm * 200) * 0.35
+            )
+
         # Snare
-        snare = 0
-        for st in [0.25, 0.75]:
-            sp = (bar_phase - st) % 1.0
-            if sp < 0.025:
-                snare += self._white_noise() * math.exp(-sp * 400) * 0.12
-        
+        snare = np.zeros(num_samples, dtype=np.float32)
+        for st in (0.25, 0.75):
+            sp = (bar_phase - np.float32(st)) % np.float32(1.0)
+            mask = sp < 0.025
+            snare[mask] += snare_white[mask] * np.exp(-sp[mask] * 400) * 0.12
+
         # Hi-hat
-        hihat = 0
+        hihat = np.zeros(num_samples, dtype=np.float32)
+        hihat_noise = hihat_fut.result()
         for hh in range(8):
-            hp = (bar_phase - hh / 8) % 1.0
-            if hp < 0.015:
-                hihat += self._filtered_noise(7000, 14000) * math.exp(-hp * 500) * 0.06
-        
+            hp = (bar_phase - np.float32(hh / 8)) % np.float32(1.0)
+            mask = hp < 0.015
+            hihat[mask] += hihat_noise[mask] * np.exp(-hp[mask] * 500) * 0.06
+
         # Bass
-        bass_notes = [55, 55, 73.4, 65.4]
-        bass_freq = bass_notes[int(bar_phase * 4) % 4]
-        bass = math.sin(t * bass_freq * 2 * math.pi) * 0.18
-        
+        bass_notes = np.array([55, 55, 73.4, 65.4], dtype=np.float32)
+        bass_freq = bass_notes[(bar_phase * 4).astype(np.int32) % 4]
+        bass = np.sin(t * bass_freq * np.float32(_TAU)) * 0.18
+
         # Pad
-        pad = 0
-        for freq in [262, 330, 392, 466]:
-            pad += math.sin(t * freq * 2 * math.pi)
-        pad *= 0.03
-        
-        # Vinyl
-        vinyl = self._filtered_noise(1500, 5000) * 0.015
-        if random.random() < 0.01:
-            vinyl += random.gauss(0, 0.06)
-        
+        pad = np.zeros(num_samples, dtype=np.float32)
+        for freq in (262, 330, 392, 466):
+            pad += _sine_wave(freq, self._sample_rate, num_samples)
+        pad *= np.float32(0.03)
+
+        # Vinyl crackle with sparse pops
+        vinyl = vinyl_fut.result()
+        vinyl *= np.float32(0.015)
+        pops = self._rng.random(num_samples, dtype=np.float32) < 0.01
+        vinyl[pops] += (
+            self._rng.standard_normal(int(pops.sum()), dtype=np.float32)
+            * np.float32(0.06)
+        )
+
         # Rain
-        rain = self._pink_noise() * 0.04
-        
-        sample = kick + snare + hihat + bass + pad + vinyl + rain
-        return math.tanh(sample * 1.1) * 0.8
-    
+        rain = rain_fut.result()
+        rain *= np.float32(0.04)
+
+        sample = kick
+        sample += snare
+        sample += hihat
+        sample += bass
+        sample += pad
+        sample += vinyl
+        sample += rain
+
+        # Soft-clip in place - no temporaries for the drive/tanh/gain
+        sample *= np.float32(1.1)
+        np.tanh(sample, out=sample)
+        sample *= np.float32(0.8)
+        return sample
+
+    # Built once at class creation; the dict holds plain functions, so
+    # lookups skip both the per-call dict build and method binding
+    _GENERATORS = {
+        "calm_rain_office": _generate_rain,
+        "forest_cafe": _generate_forest,
+        "deep_focus_spaceship": _generate_space,
+        "ocean_meditation": _generate_ocean,
+        "night_coding_lofi": _generate_lofi,
+    }
+
     # =========================================================================
     # NOISE GENERATORS
     # =========================================================================
-    
+
+    def _white_noise_buffer(self, n: int) -> "np.ndarray":
+        """A whole buffer of white noise in one draw."""
+        return self._rng.random(n, dtype=np.float32) * 2 - 1
+
+    def _pink_noise_buffer(self, n: int) -> "np.ndarray":
+        """A whole buffer of pink noise in one synchronous call."""
+        return self._shape_pink_noise(
+            self._rng.standard_normal(n, dtype=np.float32), n
+        )
+
+    def _pink_noise_future(self, n: int) -> "Future":
+        """Draw the white base now, shape it on the noise pool.
+
+        The draw stays on the calling thread, so the generator's draw
+        order never depends on worker scheduling.
+        """
+        white = self._rng.standard_normal(n, dtype=np.float32)
+        return _NOISE_POOL.submit(self._shape_pink_noise, white, n)
+
+    def _shape_pink_noise(self, white: "np.ndarray", n: int) -> "np.ndarray":
+        """Shape a pre-drawn white base into pink noise spectrally.
+
+        Weights the white spectrum by 1/sqrt(f) and inverse-transforms,
+        one rfft/irfft pair instead of the six Kellet one-pole taps.
+        The result has the exact 1/f power law the taps only
+        approximate; amplitude is normalized to the Kellet output
+        level (std ~= 0.19) the mood mix gains assume.
+        """
+        if n <= 1:
+            return np.zeros(n, dtype=np.float32)
+
+        spectrum = np.fft.rfft(white)
+        freqs = np.fft.rfftfreq(n)
+        spectrum[1:] /= np.sqrt(freqs[1:])
+        spectrum[0] = 0
+        pink = np.fft.irfft(spectrum, n).astype(np.float32)
+
+        std = float(pink.std())
+        if std > 0:
+            pink *= 0.19 / std
+        return pink
+
+    def _brown_noise_buffer(self, n: int) -> "np.ndarray":
+        """A whole buffer of brown noise in one synchronous call."""
+        return self._integrate_brown_noise(
+            self._rng.random(n, dtype=np.float32) * 2 - 1
+        )
+
+    def _brown_noise_future(self, n: int) -> "Future":
+        """Draw the white base now, integrate it on the noise pool."""
+        white = self._rng.random(n, dtype=np.float32) * 2 - 1
+        return _NOISE_POOL.submit(self._integrate_brown_noise, white)
+
+    def _integrate_brown_noise(self, white: "np.ndarray") -> "np.ndarray":
+        """Brown noise via the leaky integrator over a white base."""
+        out = _one_pole(white, 0.998, 0.998 * 0.02)
+        return np.clip(out, -1.0, 1.0, out=out)
+
+    def _filtered_noise_buffer(
+        self,
+        n: int,
+        low_freq: float,
+        high_freq: float
+    ) -> "np.ndarray":
+        """Band-limited noise in one synchronous call."""
+        return self._shape_filtered_noise(
+            self._rng.random(n, dtype=np.float32) * 2 - 1, low_freq, high_freq
+        )
+
+    def _filtered_noise_future(
+        self,
+        n: int,
+        low_freq: float,
+        high_freq: float
+    ) -> "Future":
+        """Draw the white base now, filter it on the noise pool."""
+        white = self._rng.random(n, dtype=np.float32) * 2 - 1
+        return _NOISE_POOL.submit(
+            self._shape_filtered_noise, white, low_freq, high_freq
+        )
+
+    def _shape_filtered_noise(
+        self,
+        white: "np.ndarray",
+        low_freq: float,
+        high_freq: float
+    ) -> "np.ndarray":
+        """Band-limit a white base: the scalar LP+HP one-pole pair,
+        solved blockwise."""
+        cutoff = high_freq / 12000
+        lp = _one_pole(white, 1 - cutoff, cutoff)
+        hp = low_freq / 12000
+        smoothed = _one_pole(lp, 1 - hp, hp)
+        return lp - smoothed
+
     def _white_noise(self) -> float:
         return random.uniform(-1, 1)
-    
+
     def _pink_noise(self) -> float:
         white = random.uniform(-1, 1)
-        self._noise_state[0] = 0.99886 * self._noise_state[0] + white * 0.0555179
-        self._noise_state[1] = 0.99332 * self._noise_state[1] + white * 0.0750759
-        self._noise_state[2] = 0.96900 * self._noise_state[2] + white * 0.1538520
-        self._noise_state[3] = 0.86650 * self._noise_state[3] + white * 0.3104856
-        self._noise_state[4] = 0.55000 * self._noise_state[4] + white * 0.5329522
-        self._noise_state[5] = -0.7616 * self._noise_state[5] - white * 0.0168980
-        
-        return (self._noise_state[0] + self._noise_state[1] + self._noise_state[2] +
-                self._noise_state[3] + self._noise_state[4] + self._noise_state[5] +
+        self._pink0 = 0.99886 * self._pink0 + white * 0.0555179
+        self._pink1 = 0.99332 * self._pink1 + white * 0.0750759
+        self._pink2 = 0.96900 * self._pink2 + white * 0.1538520
+        self._pink3 = 0.86650 * self._pink3 + white * 0.3104856
+        self._pink4 = 0.55000 * self._pink4 + white * 0.5329522
+        self._pink5 = -0.7616 * self._pink5 - white * 0.0168980
+
+        return (self._pink0 + self._pink1 + self._pink2 +
+                self._pink3 + self._pink4 + self._pink5 +
                 white * 0.5362) * 0.11
-    
+
     def _brown_noise(self) -> float:
         white = random.uniform(-1, 1)
-        self._noise_state[6] = (self._noise_state[6] + white * 0.02) * 0.998
-        self._noise_state[6] = max(-1, min(1, self._noise_state[6]))
-        return self._noise_state[6]
-    
+        self._brown_state = (self._brown_state + white * 0.02) * 0.998
+        self._brown_state = max(-1, min(1, self._brown_state))
+        return self._brown_state
+
     def _filtered_noise(self, low_freq: float, high_freq: float) -> float:
         white = self._white_noise()
         cutoff = high_freq / 12000
-        self._noise_state[7] = self._noise_state[7] * (1 - cutoff) + white * cutoff
+        self._lp_state = self._lp_state * (1 - cutoff) + white * cutoff
         hp = low_freq / 12000
-        self._noise_state[8] = self._noise_state[8] * (1 - hp) + self._noise_state[7] * hp
-        return self._noise_state[7] - self._noise_state[8]
-    
+        self._hp_state = self._hp_state * (1 - hp) + self._lp_state * hp
+        return self._lp_state - self._hp_state
+
     def _write_wav(
         self,
         filepath: str,
@@ -369,11 +704,23 @@ class BarkProvider(AudioProvider):
         channels: int = 1,
         bits_per_sample: int = 16
     ) -> None:
-        """Write audio data to a WAV file."""
-        import wave
-        
-        with wave.open(filepath, 'wb') as wav_file:
-            wav_file.setnchannels(channels)
-            wav_file.setsampwidth(bits_per_sample // 8)
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_data)
+        """Write audio data to a WAV file.
+
+        The samples are already little-endian PCM bytes, so the file
+        is a hand-packed 44-byte RIFF header plus one bulk write - no
+        wave-module bookkeeping or seek-back size fixup on close.
+        """
+        import struct
+
+        bytes_per_frame = channels * bits_per_sample // 8
+        header = struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF", 36 + len(audio_data), b"WAVE",
+            b"fmt ", 16, 1, channels, sample_rate,
+            sample_rate * bytes_per_frame, bytes_per_frame,
+            bits_per_sample,
+            b"data", len(audio_data),
+        )
+        with open(filepath, "wb") as wav_file:
+            wav_file.write(header)
+            wav_file.write(audio_data)
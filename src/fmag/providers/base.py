@@ -8,6 +8,22 @@ from pathlib import Path
 from typing import Optional
 
 
+_console = None
+
+
+def _get_console():
+    """Shared Console for provider logging.
+
+    Constructing a Console scans environment variables and probes the
+    terminal, so one instance is built lazily and reused.
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+
 class ProviderError(Exception):
     """Exception raised when a provider encounters an error."""
     pass
@@ -48,7 +64,11 @@ class AudioProvider(ABC):
             debug: Enable debug logging
         """
         self.debug = debug
-    
+        # Memoized results for availability()/config_help(); the checks
+        # behind them can hit the filesystem or environment on every call
+        self._available: Optional[bool] = None
+        self._config_help: Optional[str] = None
+
     @abstractmethod
     def is_available(self) -> bool:
         """
@@ -84,6 +104,140 @@ class AudioProvider(ABC):
         """
         pass
     
+    async def generate_audio_async(
+        self,
+        prompt: str,
+        duration_seconds: float,
+        output_path: str,
+        **kwargs
+    ) -> "GenerationResult":
+        """
+        Run :meth:`generate_audio` on a worker thread.
+
+        Lets an asyncio front-end service several prompts without
+        blocking the event loop. Synthesis backends built on NumPy
+        spend the hot path in C code that releases the GIL, so
+        concurrent calls genuinely overlap on multi-core machines;
+        pure-Python backends still serialize on the interpreter lock.
+
+        Args:
+            prompt: Text description of the desired audio
+            duration_seconds: Target duration in seconds
+            output_path: Path to save the generated audio
+            **kwargs: Provider-specific options
+
+        Returns:
+            GenerationResult with the generated audio details
+
+        Raises:
+            ProviderError: If generation fails
+        """
+        import asyncio
+
+        return await asyncio.to_thread(
+            self.generate_audio, prompt, duration_seconds, output_path, **kwargs
+        )
+
+    def generate_pcm(
+        self,
+        prompt: str,
+        duration_seconds: float,
+        **kwargs
+    ) -> Optional[tuple]:
+        """
+        Generate audio and return it as raw PCM in memory.
+
+        Backends that synthesize samples directly should override this
+        and return ``(frames, sample_rate)`` where ``frames`` is an
+        interleaved int16 array of shape ``(n, channels)``; callers can
+        then pipe the samples straight into post-processing without an
+        intermediate audio file on disk. The default returns None,
+        meaning the backend only produces files via
+        :meth:`generate_audio`.
+
+        Args:
+            prompt: Text description of the desired audio
+            duration_seconds: Target duration in seconds
+            **kwargs: Provider-specific options
+
+        Returns:
+            ``(frames, sample_rate)`` tuple, or None if unsupported
+
+        Raises:
+            ProviderError: If generation fails
+        """
+        return None
+
+    def generate_audio_batch(
+        self,
+        prompts: list[str],
+        duration_seconds: float,
+        output_paths: list[str],
+        **kwargs
+    ) -> list["GenerationResult"]:
+        """
+        Generate audio for several prompts in one call.
+
+        Backends with a true batch dimension (GPU model inference)
+        should override this to amortize model load across items;
+        the default simply generates sequentially.
+
+        Args:
+            prompts: Text descriptions, one per output
+            duration_seconds: Target duration for every item
+            output_paths: Paths to save each generated audio
+            **kwargs: Provider-specific options
+
+        Returns:
+            List of GenerationResult, in prompt order
+
+        Raises:
+            ProviderError: If generation fails
+        """
+        return [
+            self.generate_audio(prompt, duration_seconds, output_path, **kwargs)
+            for prompt, output_path in zip(prompts, output_paths)
+        ]
+
+    def warmup(self) -> None:
+        """
+        Prepare the provider for its first generation call.
+
+        Run from a background thread right after construction so that
+        expensive setup overlaps validation and user interaction. The
+        default primes the memoized availability and config-help
+        checks; backends with real model state (weights, HTTP
+        sessions) should override this and load it here.
+        """
+        self.availability()
+        self.config_help()
+
+    def availability(self) -> bool:
+        """
+        Memoized wrapper around :meth:`is_available`.
+
+        Availability cannot change within a process (it depends on
+        installed packages and API keys), so repeated validation
+        re-uses the first answer.
+
+        Returns:
+            True if the provider can be used
+        """
+        if self._available is None:
+            self._available = self.is_available()
+        return self._available
+
+    def config_help(self) -> str:
+        """
+        Memoized wrapper around :meth:`get_config_help`.
+
+        Returns:
+            Human-readable configuration instructions
+        """
+        if self._config_help is None:
+            self._config_help = self.get_config_help()
+        return self._config_help
+
     def get_config_help(self) -> str:
         """
         Get help text for configuring this provider.
@@ -96,6 +250,5 @@ class AudioProvider(ABC):
     def log(self, message: str) -> None:
         """Log a debug message if debug mode is enabled."""
         if self.debug:
-            from rich.console import Console
-            Console().print(f"[dim][{self.name}] {message}[/dim]")
+            _get_console().print(f"[dim][{self.name}] {message}[/dim]")
 
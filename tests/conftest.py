@@ -0,0 +1,126 @@
+"""
+Shared fixtures for the FMAG test suite.
+"""
+
+import subprocess
+
+import pytest
+from unittest.mock import create_autospec, patch
+
+import fmag.audio_utils
+import fmag.core
+from fmag.presets import PRESETS, get_preset_choices, list_presets
+from fmag.providers import get_provider
+from fmag.providers.base import AudioProvider
+
+
+# Patch targets resolved once at import; patch.object skips the
+# dotted-path parse and module re-import that string targets pay on
+# every patch entry
+_PATCH_TARGETS = {
+    "processor": (fmag.core, "AudioProcessor"),
+    "subprocess_run": (fmag.audio_utils.subprocess, "run"),
+}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked slow (environment probes)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip slow-marked tests unless --run-slow is given."""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="needs --run-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def presets_snapshot():
+    """Materialize the preset tables and prompts once per session.
+
+    The preset registry is immutable, so its name list, menu choices
+    and assembled prompts can be computed a single time and read by
+    every test instead of rebuilt per test.
+    """
+    return {
+        "all": PRESETS,
+        "names": list_presets(),
+        "choices": get_preset_choices(),
+        "prompts": {name: preset.to_prompt() for name, preset in PRESETS.items()},
+        "prompts_lower": {
+            name: preset.to_prompt().lower() for name, preset in PRESETS.items()
+        },
+    }
+
+
+@pytest.fixture(scope="module")
+def audiogen_provider():
+    """One audiogen provider per module for tests that only read it."""
+    return get_provider("audiogen")
+
+
+@pytest.fixture(scope="module")
+def bark_provider():
+    """One bark provider per module for tests that only read it."""
+    return get_provider("bark")
+
+
+@pytest.fixture(scope="module")
+def provider_spec():
+    """Autospec of AudioProvider, introspected once per module."""
+    return create_autospec(AudioProvider, instance=True)
+
+
+@pytest.fixture
+def mock_provider(provider_spec):
+    """The shared provider autospec, reset for each test."""
+    provider_spec.reset_mock(return_value=True, side_effect=True)
+    return provider_spec
+
+
+@pytest.fixture(scope="session")
+def shared_tmpdir(tmp_path_factory):
+    """One scratch directory shared by tests that only need a path.
+
+    The integration tests never write real audio (the processor and
+    ffmpeg are mocked), so a single session directory avoids a
+    mkdir/rmtree pair per test.
+    """
+    return str(tmp_path_factory.mktemp("fmag-tests"))
+
+
+@pytest.fixture(scope="module")
+def mock_audio_processor():
+    """Patch fmag.core.AudioProcessor once per module.
+
+    The per-test @patch decorators paid mock setup, teardown and
+    dotted-path resolution for every test; one module-scoped patch
+    covers all tests that only need the processor out of the way.
+    """
+    with patch.object(*_PATCH_TARGETS["processor"]) as mock_processor:
+        yield mock_processor
+
+
+@pytest.fixture(scope="module")
+def mock_ffmpeg_run():
+    """Patch subprocess.run in audio_utils once per module.
+
+    The mocked ffmpeg/ffprobe always succeeds and reports a duration
+    of 1.0 seconds, which is all the non-pipeline tests ever check.
+    The canned result is a plain CompletedProcess rather than a
+    MagicMock, so reading returncode/stdout off it is a direct
+    attribute access with no mock attribute machinery behind it.
+    """
+    with patch.object(*_PATCH_TARGETS["subprocess_run"]) as mock_run:
+        mock_run.return_value = subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="1.0", stderr=""
+        )
+        yield mock_run
@@ -0,0 +1,79 @@
+"""
+Integration tests that run a real ffmpeg binary.
+
+These live in their own module: test_core's module-scoped
+``mock_ffmpeg_run`` fixture keeps subprocess.run patched for the rest
+of that file once any test has used it, which would turn every ffmpeg
+invocation here into a no-op.
+"""
+
+import wave
+
+import numpy as np
+import pytest
+
+from fmag.audio_utils import AudioProcessor, check_ffmpeg_installed
+
+pytestmark = pytest.mark.skipif(
+    not check_ffmpeg_installed(), reason="requires a real ffmpeg"
+)
+
+
+def _write_tone(path: str, sample_rate: int, seconds: int) -> None:
+    """Write a mono 220 Hz sine WAV for pipeline inputs."""
+    t = np.arange(sample_rate * seconds) / sample_rate
+    tone = (12000 * np.sin(2 * np.pi * 220 * t)).astype(np.int16)
+    with wave.open(path, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(tone.tobytes())
+
+
+def _wav_duration(path: str) -> float:
+    """Read a WAV file's duration from its header."""
+    with wave.open(path, "rb") as wav_file:
+        return wav_file.getnframes() / wav_file.getframerate()
+
+
+class TestLoopCrossfade:
+    """Tests for the in-graph loop crossfade through real ffmpeg."""
+
+    def test_full_pipeline_keeps_duration(self, tmp_path):
+        """Test the full pipeline's loop crossfade end-to-end.
+
+        A 3s input with a 1s loop crossfade must come out 2s long:
+        blending the tail into the head trims exactly one crossfade's
+        worth of audio — no more (a regression here once passed only
+        the middle segment through, dropping head and tail entirely).
+        """
+        input_path = str(tmp_path / "in.wav")
+        _write_tone(input_path, sample_rate=8000, seconds=3)
+
+        processor = AudioProcessor()
+        output_path = str(tmp_path / "out.mp3")
+        processor.process_full_pipeline(
+            input_path=input_path,
+            output_path=output_path,
+            crossfade=1.0
+        )
+
+        # Decode the result and measure it; mp3 framing pads the tail
+        # slightly, so allow a coarse tolerance
+        decoded_path = str(tmp_path / "decoded.wav")
+        processor._run_ffmpeg(["-i", output_path, decoded_path])
+        assert abs(_wav_duration(decoded_path) - 2.0) < 0.1
+
+    def test_optimize_for_loop_keeps_duration(self, tmp_path):
+        """Test the standalone loop optimizer through real ffmpeg."""
+        input_path = str(tmp_path / "in.wav")
+        _write_tone(input_path, sample_rate=8000, seconds=3)
+
+        processor = AudioProcessor()
+        output_path = str(tmp_path / "looped.wav")
+        processor.optimize_for_loop(
+            input_path, output_path, crossfade_duration=1.0
+        )
+
+        # WAV in, WAV out: the duration is exact
+        assert _wav_duration(output_path) == pytest.approx(2.0)